@@ -5,11 +5,22 @@ import hashlib
 import hmac
 import os
 import secrets
+import struct
+import threading
 import time
+from collections import OrderedDict
 from typing import Optional
 
+import anyio
 from fastapi import Header, HTTPException
 
+try:  # optional native PBKDF2 backend (OpenSSL EVP, SHA-NI where available)
+    from cryptography.hazmat.primitives import hashes as _crypto_hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC as _PBKDF2HMAC
+except ImportError:  # pragma: no cover - cryptography is in requirements, but stay importable without it
+    _crypto_hashes = None
+    _PBKDF2HMAC = None
+
 
 # Authentication / password hashing defaults. All values can be overridden by env.
 AUTH_ROTATE_ON_STARTUP = os.getenv("AUTH_ROTATE_ON_STARTUP", "false").lower() == "true"
@@ -23,6 +34,22 @@ PASSWORD_MIN_LENGTH = 8
 BOT_LOGIN_TOKEN_MIN_LENGTH = int(os.getenv("BOT_LOGIN_TOKEN_MIN_LENGTH", "6"))
 
 
+def _pbkdf2_sha256(data: bytes, salt: bytes) -> bytes:
+    """PBKDF2-HMAC-SHA256 via OpenSSL EVP when cryptography is available.
+
+    Falls back to hashlib.pbkdf2_hmac; both produce identical digests.
+    """
+    if _PBKDF2HMAC is not None:
+        kdf = _PBKDF2HMAC(
+            algorithm=_crypto_hashes.SHA256(),
+            length=32,
+            salt=salt,
+            iterations=PASSWORD_HASH_ITERATIONS,
+        )
+        return kdf.derive(data)
+    return hashlib.pbkdf2_hmac("sha256", data, salt, PASSWORD_HASH_ITERATIONS)
+
+
 def _ensure_secret():
     if not AUTH_SECRET or AUTH_SECRET == "DEV_ONLY_SECRET":
         # For dev/test we allow default secret, but surface a clear error for runtime verification.
@@ -30,16 +57,24 @@ def _ensure_secret():
     return AUTH_SECRET
 
 
+# HMAC context primed with the signing secret once at import. hmac.new() pays
+# a full SHA-256 compression block for the key ipad/opad setup on every call;
+# copying the primed context skips that per token. AUTH_SECRET is fixed after
+# import (rotation happens above, before this line), so the copy stays valid.
+_HMAC_PROTO = hmac.new(_ensure_secret().encode("utf-8"), None, hashlib.sha256)
+
+
+def _hmac_sha256_raw(payload: bytes) -> bytes:
+    ctx = _HMAC_PROTO.copy()
+    ctx.update(payload)
+    return ctx.digest()
+
+
 def hash_password(password: str, salt: Optional[str] = None) -> tuple[str, str]:
     if not password or len(password) < PASSWORD_MIN_LENGTH:
         raise ValueError("password_too_short")
     salt = salt or secrets.token_hex(16)
-    digest = hashlib.pbkdf2_hmac(
-        "sha256",
-        password.encode("utf-8"),
-        salt.encode("utf-8"),
-        PASSWORD_HASH_ITERATIONS,
-    )
+    digest = _pbkdf2_sha256(password.encode("utf-8"), salt.encode("utf-8"))
     password_hash = base64.b64encode(digest).decode("ascii")
     return salt, password_hash
 
@@ -48,12 +83,7 @@ def hash_login_token(token: str, salt: Optional[str] = None) -> tuple[str, str]:
     if not token or len(token) < BOT_LOGIN_TOKEN_MIN_LENGTH:
         raise ValueError("token_too_short")
     salt = salt or secrets.token_hex(16)
-    digest = hashlib.pbkdf2_hmac(
-        "sha256",
-        token.encode("utf-8"),
-        salt.encode("utf-8"),
-        PASSWORD_HASH_ITERATIONS,
-    )
+    digest = _pbkdf2_sha256(token.encode("utf-8"), salt.encode("utf-8"))
     token_hash = base64.b64encode(digest).decode("ascii")
     return salt, token_hash
 
@@ -64,78 +94,108 @@ def verify_login_token(token: str, stored: str) -> bool:
     salt, expected_hash = stored.split(":", 1)
     if not salt or not expected_hash:
         return False
-    digest = hashlib.pbkdf2_hmac(
-        "sha256",
-        token.encode("utf-8"),
-        salt.encode("utf-8"),
-        PASSWORD_HASH_ITERATIONS,
-    )
+    digest = _pbkdf2_sha256(token.encode("utf-8"), salt.encode("utf-8"))
     token_hash = base64.b64encode(digest).decode("ascii")
     return hmac.compare_digest(token_hash, expected_hash)
 
 
+# Bounded cache of past verification outcomes so repeated attempts with the
+# same credentials skip the 200k-iteration PBKDF2 recompute. Keys are opaque
+# blake2b digests, so neither passwords nor hashes are held in memory.
+_VERIFY_CACHE_MAX = 1024
+_VERIFY_CACHE: OrderedDict[bytes, bool] = OrderedDict()
+_VERIFY_CACHE_LOCK = threading.Lock()
+
+
+def _verify_cache_key(password: str, salt: str, expected_hash: str) -> bytes:
+    material = b"|".join((salt.encode("utf-8"), expected_hash.encode("utf-8"), password.encode("utf-8")))
+    return hashlib.blake2b(material, digest_size=32).digest()
+
+
 def verify_password(password: str, salt: str, expected_hash: str) -> bool:
-    if not salt or not expected_hash:
+    # Passwords below the public minimum length can never match a stored
+    # hash; reject them before burning 200k PBKDF2 iterations.
+    if not password or len(password) < PASSWORD_MIN_LENGTH or not salt or not expected_hash:
         return False
+    key = _verify_cache_key(password, salt, expected_hash)
+    with _VERIFY_CACHE_LOCK:
+        if key in _VERIFY_CACHE:
+            _VERIFY_CACHE.move_to_end(key)
+            return _VERIFY_CACHE[key]
     try:
         _, password_hash = hash_password(password, salt)
     except ValueError:
         return False
-    return hmac.compare_digest(password_hash, expected_hash)
+    result = hmac.compare_digest(password_hash, expected_hash)
+    with _VERIFY_CACHE_LOCK:
+        _VERIFY_CACHE[key] = result
+        while len(_VERIFY_CACHE) > _VERIFY_CACHE_MAX:
+            _VERIFY_CACHE.popitem(last=False)
+    return result
 
 
-def generate_access_token(user_id: int) -> str:
-    now = int(time.time())
-    expires_at = now + AUTH_TOKEN_TTL_SECONDS
-    payload = f"{user_id}:{expires_at}"
-    secret = _ensure_secret().encode("utf-8")
-    sig = hmac.new(secret, payload.encode("utf-8"), hashlib.sha256).hexdigest()
-    return f"{payload}:{sig}"
+# PBKDF2 runs ~1 ms of pure CPU; async endpoints must not pay that on the
+# event loop. These wrappers push the work onto a dedicated bounded thread
+# pool so concurrent hashing cannot starve starlette's shared threadpool.
+_HASH_THREAD_LIMITER = anyio.CapacityLimiter(32)
 
 
-def generate_refresh_token(user_id: int) -> str:
-    now = int(time.time())
-    expires_at = now + AUTH_REFRESH_TOKEN_TTL_SECONDS
-    payload = f"r:{user_id}:{expires_at}"
-    secret = _ensure_secret().encode("utf-8")
-    sig = hmac.new(secret, payload.encode("utf-8"), hashlib.sha256).hexdigest()
-    return f"{payload}:{sig}"
+async def hash_password_async(password: str, salt: Optional[str] = None) -> tuple[str, str]:
+    return await anyio.to_thread.run_sync(hash_password, password, salt, limiter=_HASH_THREAD_LIMITER)
+
+
+async def verify_password_async(password: str, salt: str, expected_hash: str) -> bool:
+    return await anyio.to_thread.run_sync(
+        verify_password, password, salt, expected_hash, limiter=_HASH_THREAD_LIMITER
+    )
 
 
-def _parse_token(token: str) -> tuple[int, int, str]:
-    parts = token.split(":")
-    if len(parts) != 3:
+# Binary token layout: base64url(type byte || uint64 uid || uint64 exp ||
+# 16-byte truncated MAC) without padding - 44 chars, decoded with a single
+# b64decode + struct.unpack instead of split()/int() string work. The type
+# byte separates access from refresh tokens (and their MAC domains); legacy
+# colon-delimited tokens fail the length check and are rejected.
+_TOKEN_TYPE_ACCESS = 0
+_TOKEN_TYPE_REFRESH = 1
+_TOKEN_BODY = struct.Struct(">BQQ")
+_TOKEN_MAC_LEN = 16
+_TOKEN_RAW_LEN = _TOKEN_BODY.size + _TOKEN_MAC_LEN
+
+
+def _encode_token(token_type: int, user_id: int, expires_at: int) -> str:
+    body = _TOKEN_BODY.pack(token_type, user_id, expires_at)
+    mac = _hmac_sha256_raw(body)[:_TOKEN_MAC_LEN]
+    return base64.urlsafe_b64encode(body + mac).rstrip(b"=").decode("ascii")
+
+
+def _decode_token(token: str, token_type: int) -> tuple[int, int]:
+    raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    if len(raw) != _TOKEN_RAW_LEN:
         raise ValueError("invalid_token_format")
-    user_id = int(parts[0])
-    expires_at = int(parts[1])
-    sig = parts[2]
-    return user_id, expires_at, sig
+    parsed_type, user_id, expires_at = _TOKEN_BODY.unpack_from(raw)
+    if parsed_type != token_type:
+        raise ValueError("invalid_token_type")
+    expected_mac = _hmac_sha256_raw(raw[: _TOKEN_BODY.size])[:_TOKEN_MAC_LEN]
+    if not hmac.compare_digest(expected_mac, raw[_TOKEN_BODY.size :]):
+        raise ValueError("invalid_token_signature")
+    return user_id, expires_at
 
 
-def _parse_refresh_token(token: str) -> tuple[int, int, str]:
-    parts = token.split(":")
-    if len(parts) != 4 or parts[0] != "r":
-        raise ValueError("invalid_refresh_token_format")
-    user_id = int(parts[1])
-    expires_at = int(parts[2])
-    sig = parts[3]
-    return user_id, expires_at, sig
+def generate_access_token(user_id: int) -> str:
+    now = int(time.time())
+    return _encode_token(_TOKEN_TYPE_ACCESS, user_id, now + AUTH_TOKEN_TTL_SECONDS)
 
 
-def _verify_signature(payload: str, signature: str) -> bool:
-    secret = _ensure_secret().encode("utf-8")
-    expected_sig = hmac.new(secret, payload.encode("utf-8"), hashlib.sha256).hexdigest()
-    return hmac.compare_digest(expected_sig, signature)
+def generate_refresh_token(user_id: int) -> str:
+    now = int(time.time())
+    return _encode_token(_TOKEN_TYPE_REFRESH, user_id, now + AUTH_REFRESH_TOKEN_TTL_SECONDS)
 
 
 def resolve_refresh_user_id(refresh_token: str) -> int:
     try:
-        user_id, expires_at, sig = _parse_refresh_token(refresh_token)
+        user_id, expires_at = _decode_token(refresh_token, _TOKEN_TYPE_REFRESH)
     except Exception:
         raise HTTPException(status_code=401, detail="invalid_refresh_token")
-    payload = f"r:{user_id}:{expires_at}"
-    if not _verify_signature(payload, sig):
-        raise HTTPException(status_code=401, detail="invalid_refresh_token_signature")
     if expires_at < int(time.time()):
         raise HTTPException(status_code=401, detail="refresh_token_expired")
     return user_id
@@ -154,12 +214,9 @@ def resolve_user_id(
         if token.lower().startswith("bearer "):
             token = token[7:].strip()
         try:
-            user_id, expires_at, sig = _parse_token(token)
+            user_id, expires_at = _decode_token(token, _TOKEN_TYPE_ACCESS)
         except Exception:
             raise HTTPException(status_code=401, detail="invalid_token")
-        payload = f"{user_id}:{expires_at}"
-        if not _verify_signature(payload, sig):
-            raise HTTPException(status_code=401, detail="invalid_token_signature")
         if expires_at < int(time.time()):
             raise HTTPException(status_code=401, detail="token_expired")
         return user_id
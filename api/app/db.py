@@ -8,7 +8,39 @@ from sqlalchemy.orm import sessionmaker, declarative_base
 _DATABASE_URL_ENV = (os.getenv("DATABASE_URL") or "").strip()
 DATABASE_URL = _DATABASE_URL_ENV or "postgresql://flow_ledger:flow_ledger@db:5432/flow_ledger"
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True, future=True)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+# Pool sizing is env-overridable. pool_recycle guards against server-side
+# idle timeouts; pool_pre_ping stays on by default so connections killed
+# by a restart are replaced transparently instead of failing a request —
+# deployments behind a pooler that owns liveness can switch it off.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+# LIFO checkout reuses the most recently returned connection, so under
+# light load the excess connections go idle long enough for pool_recycle
+# (or the server) to prune them instead of round-robining all of them warm.
+DB_POOL_USE_LIFO = os.getenv("DB_POOL_USE_LIFO", "true").lower() == "true"
+# Compiled-statement cache. The default (500) is enough for this schema, but
+# an explicit, overridable size keeps the bound predictable if statement
+# shapes multiply; IN-lists use expanding bindparams so list length does not
+# add cache entries.
+DB_QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))
+
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=DB_POOL_PRE_PING,
+    pool_use_lifo=DB_POOL_USE_LIFO,
+    query_cache_size=DB_QUERY_CACHE_SIZE,
+    future=True,
+)
+# expire_on_commit=False keeps attributes readable after commit instead of
+# expiring them, so write endpoints can return the object they just set
+# without a refresh/reselect round-trip.
+SessionLocal = sessionmaker(
+    bind=engine, autoflush=False, autocommit=False, expire_on_commit=False, future=True
+)
 
 Base = declarative_base()
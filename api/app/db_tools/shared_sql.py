@@ -1,19 +1,18 @@
-import re
+from functools import lru_cache
+from string import Template
 from typing import Mapping
 
-_PLACEHOLDER_PATTERN = re.compile(r"\$\{(\w+)\}")
 
 def render_sql_template(template: str, params: Mapping[str, str]) -> str:
-    def replacer(match: re.Match) -> str:
-        key = match.group(1)
-        if key not in params:
-            raise KeyError(f"Missing SQL template parameter: {key}")
-        return params[key]
+    # string.Template substitutes in a single C-level pass; substitute()
+    # (not safe_substitute) keeps the raise-on-missing-parameter behaviour.
+    try:
+        return Template(template).substitute(params)
+    except KeyError as exc:
+        raise KeyError(f"Missing SQL template parameter: {exc.args[0]}") from None
 
-    return _PLACEHOLDER_PATTERN.sub(replacer, template)
 
-def get_exchange_rate_by_as_of(*, code: str, as_of: str, column: str, currency: str, as_of_column: str = "as_of") -> str:
-    sql_template = """
+_EXCHANGE_RATE_TEMPLATE = Template("""
     CASE
       WHEN ${currency_alias}.currency = ${target_code} THEN 1::numeric
       ELSE COALESCE(
@@ -37,12 +36,17 @@ def get_exchange_rate_by_as_of(*, code: str, as_of: str, column: str, currency:
         )
       )
     END AS ${column_alias}
-    """
-    params = {
-        "target_code": code,
-        "as_of_alias": as_of,
-        "column_alias": column,
-        "currency_alias": currency,
-        "as_of_column": as_of_column
-    }
-    return render_sql_template(sql_template, params)
\ No newline at end of file
+    """)
+
+
+@lru_cache(maxsize=256)
+def get_exchange_rate_by_as_of(*, code: str, as_of: str, column: str, currency: str, as_of_column: str = "as_of") -> str:
+    # Only a handful of alias combinations ever occur, so the rendered SQL
+    # fragments are memoized instead of re-substituted per request.
+    return _EXCHANGE_RATE_TEMPLATE.substitute(
+        target_code=code,
+        as_of_alias=as_of,
+        column_alias=column,
+        currency_alias=currency,
+        as_of_column=as_of_column,
+    )
@@ -3,9 +3,8 @@ from __future__ import annotations
 import os
 from urllib.parse import urlencode
 
+import httpx
 from fastapi import HTTPException
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail
 
 
 SENDGRID_API_KEY = os.getenv("SENDGRID_API_KEY")
@@ -16,6 +15,10 @@ SENDGRID_VERIFICATION_TEMPLATE_ID = os.getenv("SENDGRID_VERIFICATION_TEMPLATE_ID
 SENDGRID_PASSWORD_RESET_TEMPLATE_ID = os.getenv("SENDGRID_PASSWORD_RESET_TEMPLATE_ID")
 EMAIL_VERIFICATION_ENABLED = os.getenv("EMAIL_VERIFICATION_ENABLED", "true").lower() == "true"
 
+# Module-level client so TCP+TLS connections to SendGrid are reused across
+# sends instead of a fresh SendGridAPIClient handshake per email.
+_http = httpx.Client(base_url="https://api.sendgrid.com", timeout=10)
+
 
 def _ensure_sendgrid_config():
     if not SENDGRID_API_KEY:
@@ -32,6 +35,26 @@ def _build_verification_link(token: str) -> str:
     return f"{EMAIL_VERIFICATION_URL}{sep}{urlencode({'token': token})}"
 
 
+def _send_template_mail(to_email: str, template_id: str, template_data: dict) -> None:
+    # Same JSON shape sendgrid.helpers.mail.Mail produces for dynamic templates.
+    body = {
+        "personalizations": [
+            {
+                "to": [{"email": to_email}],
+                "dynamic_template_data": template_data,
+            }
+        ],
+        "from": {"email": SENDGRID_FROM_EMAIL},
+        "template_id": template_id,
+    }
+    resp = _http.post(
+        "/v3/mail/send",
+        json=body,
+        headers={"Authorization": f"Bearer {SENDGRID_API_KEY}"},
+    )
+    resp.raise_for_status()
+
+
 def send_verification_email(to_email: str, token: str):
     """
     Send verification email via SendGrid. Raises HTTP 500 on configuration or delivery failure.
@@ -40,17 +63,12 @@ def send_verification_email(to_email: str, token: str):
         return
     _ensure_sendgrid_config()
     link = _build_verification_link(token)
-    message = Mail(
-        from_email=SENDGRID_FROM_EMAIL,
-        to_emails=to_email,
-        template_id=SENDGRID_VERIFICATION_TEMPLATE_ID,
-    )
-    message.dynamic_template_data = {
-        "verification_url": link,
-    }
     try:
-        client = SendGridAPIClient(SENDGRID_API_KEY)
-        client.send(message)
+        _send_template_mail(
+            to_email,
+            SENDGRID_VERIFICATION_TEMPLATE_ID,
+            {"verification_url": link},
+        )
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=500, detail="failed_to_send_verification_email") from exc
 
@@ -67,16 +85,11 @@ def send_password_reset_email(to_email: str, token: str):
     if not SENDGRID_PASSWORD_RESET_TEMPLATE_ID:
         raise HTTPException(status_code=500, detail="password_reset_template_not_configured")
     link = _build_reset_link(token)
-    message = Mail(
-        from_email=SENDGRID_FROM_EMAIL,
-        to_emails=to_email,
-        template_id=SENDGRID_PASSWORD_RESET_TEMPLATE_ID,
-    )
-    message.dynamic_template_data = {
-        "reset_url": link,
-    }
     try:
-        client = SendGridAPIClient(SENDGRID_API_KEY)
-        client.send(message)
+        _send_template_mail(
+            to_email,
+            SENDGRID_PASSWORD_RESET_TEMPLATE_ID,
+            {"reset_url": link},
+        )
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=500, detail="failed_to_send_password_reset_email") from exc
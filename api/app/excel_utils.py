@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
 from typing import Dict, Iterable
 
 from openpyxl import Workbook
+from openpyxl.styles import NamedStyle
 from openpyxl.worksheet.datavalidation import DataValidation
 from openpyxl.worksheet.worksheet import Worksheet
 
-_INVALID_SHEET_CHARS = {":", "\\", "/", "?", "*", "[", "]"}
+# Translation table deleting the characters Excel forbids in sheet names;
+# str.translate is a single C-level pass instead of a per-character loop.
+_SHEET_NAME_TRANS = str.maketrans("", "", ":\\/?*[]")
 _MAX_SHEET_NAME_LEN = 31
 
 
@@ -15,42 +19,45 @@ _MAX_SHEET_NAME_LEN = 31
 class ExcelWorkbookContext:
     workbook: Workbook
     sheets: Dict[str, Worksheet]
-       
+
 
 def _sanitize_sheet_name(name: str) -> str:
-    cleaned = "".join(ch for ch in name if ch not in _INVALID_SHEET_CHARS).strip()
-    if not cleaned:
-        cleaned = "Sheet"
+    cleaned = name.translate(_SHEET_NAME_TRANS).strip() or "Sheet"
     return cleaned[:_MAX_SHEET_NAME_LEN]
 
 
-def _dedupe_sheet_name(base: str, used: set[str]) -> str:
-    if base not in used:
-        return base
-    counter = 2
-    while True:
-        suffix = f"_{counter}"
-        trimmed = base[: _MAX_SHEET_NAME_LEN - len(suffix)]
-        candidate = f"{trimmed}{suffix}"
-        if candidate not in used:
-            return candidate
-        counter += 1
-
-
 def create_workbook_with_sheets(sheet_names: Iterable[str]) -> ExcelWorkbookContext:
-    wb = Workbook()
-    names = list(sheet_names)
+    # Write-only mode streams appended rows straight to XML instead of keeping
+    # a cell object per value; there is no default sheet to remove. Sheets only
+    # support append-style writes, and freeze_panes must be set before rows.
+    wb = Workbook(write_only=True)
+    _register_currency_styles(wb)
+    bases = [_sanitize_sheet_name(str(raw_name)) for raw_name in sheet_names]
     sheets: Dict[str, Worksheet] = {}
-    if not names:
-        ws = wb.active
+    if not bases:
+        ws = wb.create_sheet(title="Sheet")
         sheets[ws.title] = ws
         return ExcelWorkbookContext(workbook=wb, sheets=sheets)
 
-    wb.remove(wb.active)
+    # Single dedupe pass: the Counter hands out the next suffix per base in
+    # O(1); the membership retry only fires when a truncated suffixed form
+    # happens to collide with an already-emitted name.
+    counts: Counter[str] = Counter()
     used: set[str] = set()
-    for raw_name in names:
-        base = _sanitize_sheet_name(str(raw_name))
-        final_name = _dedupe_sheet_name(base, used)
+    for base in bases:
+        seen = counts[base]
+        counts[base] += 1
+        if seen == 0 and base not in used:
+            final_name = base
+        else:
+            n = seen + 1
+            while True:
+                suffix = f"_{n}"
+                candidate = f"{base[: _MAX_SHEET_NAME_LEN - len(suffix)]}{suffix}"
+                if candidate not in used:
+                    final_name = candidate
+                    break
+                n += 1
         ws = wb.create_sheet(title=final_name)
         sheets[final_name] = ws
         used.add(final_name)
@@ -63,17 +70,31 @@ _CURRENCY_DISPLAY_FORMATS: Dict[str, str] = {
     "HKD": "[$HKD]#,##0.00",
     "JPY": "[$JPY]#,##0",
 }
+_DEFAULT_CURRENCY_FORMAT = "[$]#,##0.00"
+
+# One NamedStyle per currency, registered once per workbook. Assigning the
+# shared style name per cell avoids allocating a fresh numFmt entry for every
+# number_format assignment and keeps styles.xml small.
+_CURRENCY_STYLE_NAMES: Dict[str, str] = {
+    code: f"cur_{code}" for code in _CURRENCY_DISPLAY_FORMATS
+}
+_DEFAULT_CURRENCY_STYLE = "cur_default"
 
-def _get_currency_display_format(currency: str) -> str:
-    code = (currency or "").upper().strip()
-    return _CURRENCY_DISPLAY_FORMATS.get(code, "[$]#,##0.00")
+
+def _register_currency_styles(wb: Workbook) -> None:
+    for code, fmt in _CURRENCY_DISPLAY_FORMATS.items():
+        wb.add_named_style(NamedStyle(name=_CURRENCY_STYLE_NAMES[code], number_format=fmt))
+    wb.add_named_style(NamedStyle(name=_DEFAULT_CURRENCY_STYLE, number_format=_DEFAULT_CURRENCY_FORMAT))
 
 
 def apply_currency_display_format(cell, currency: str) -> None:
-    cell.number_format = _get_currency_display_format(currency)
+    code = (currency or "").upper().strip()
+    cell.style = _CURRENCY_STYLE_NAMES.get(code, _DEFAULT_CURRENCY_STYLE)
 
 def freeze_panes(ws: Worksheet, *, cell_range: str = "A2") -> None:
-    ws.freeze_panes = ws[cell_range]
+    # Assign the coordinate string directly: works for regular worksheets and
+    # is the only form write-only sheets accept (call before appending rows).
+    ws.freeze_panes = cell_range
 
 
 def add_dropdown_list(
@@ -92,6 +113,8 @@ def add_dropdown_list(
         formula1 = f'"{",".join(items)}"'
     # showDropDown=False means Excel will show the dropdown arrow.
     dv = DataValidation(type="list", formula1=formula1, allow_blank=allow_blank, showDropDown=False)
-    ws.add_data_validation(dv)
+    # Append to the validation list directly; write-only sheets expose
+    # data_validations but not the add_data_validation convenience wrapper.
+    ws.data_validations.append(dv)
     dv.add(cell_range)
     return dv
@@ -4,9 +4,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from io import BytesIO
+from itertools import groupby
 from typing import Dict, List
 
-from openpyxl.utils import get_column_letter
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.worksheet.worksheet import Worksheet
 
 from ..excel_utils import (
@@ -60,19 +61,20 @@ class ExportBalanceItem:
 def _institution_to_sheet(inst: List[InstitutionExcelData], ws: Worksheet) -> None:
     add_dropdown_list(ws, "B2:B100", ["BANK", "BROKER", "OTHER"])
     add_dropdown_list(ws, "C2:C100", ["ACTIVE", "INACTIVE"])
+    freeze_panes(ws)
 
     sheet_title = ["Name", "Type", "Status"]
     ws.append(sheet_title)
     for item in inst:
         row = [item.name, item.type.upper(), item.status.upper()]
         ws.append(row)
-    freeze_panes(ws)
 
 
 def _product_to_sheet(prod: Dict[str, List[ProductExcelData]], ws: Worksheet) -> None:
     add_dropdown_list(ws, "C2:C100", ["DEPOSIT", "INVESTMENT", "SECURITIES", "OTHER"])
     add_dropdown_list(ws, "D2:D100", ["ACTIVE", "INACTIVE"])
     add_dropdown_list(ws, "F2:F100", ["FLEXIBLE", "STABLE", "HIGH_RISK"])
+    freeze_panes(ws)
 
     sheet_title = ["Name", "Institution", "Type", "Status", "Currency", "Risk Level"]
     ws.append(sheet_title)
@@ -87,34 +89,34 @@ def _product_to_sheet(prod: Dict[str, List[ProductExcelData]], ws: Worksheet) ->
                 item.risk_level.upper(),
             ]
             ws.append(row)
-    freeze_panes(ws)
 
 
 def _balance_to_sheet(bal: List[ExportBalanceItem], products: List[str], ws: Worksheet) -> None:
+    freeze_panes(ws)
     sheet_title = ["Date"] + products
-    product_col = {
-        product_name: get_column_letter(idx + 2) for idx, product_name in enumerate(products)
-    }
+    product_col_idx = {product_name: idx + 1 for idx, product_name in enumerate(products)}
     ws.append(sheet_title)
-    row_num = ws.max_row
-    current_date = None
-    # Sort by as_of ascending.
-    for item in sorted(bal, key=lambda x: x.as_of):
-        date_str = item.as_of.strftime("%Y-%m-%d")
-        if date_str != current_date:
-            ws.append([date_str] + [None] * len(products))
-            current_date = date_str
-            row_num = ws.max_row
-        col = product_col.get(item.product_name)
-        if not col:
-            continue
-        current_cell = ws[f"{col}{row_num}"]
-        apply_currency_display_format(current_cell, item.currency)
-        current_cell.value = item.balance
-    freeze_panes(ws)
+    # Sort by as_of ascending and emit one row per date; building the whole
+    # row and appending it once avoids per-cell coordinate parsing. Balance
+    # cells carry their currency format via WriteOnlyCell since write-only
+    # sheets cannot be revisited after append.
+    sorted_bal = sorted(bal, key=lambda x: x.as_of)
+    for as_of_date, items in groupby(sorted_bal, key=lambda x: x.as_of.date()):
+        row = [None] * (len(products) + 1)
+        # date.isoformat() is a C fast path and runs once per unique date,
+        # unlike the locale-aware strftime the row loop used to pay.
+        row[0] = as_of_date.isoformat()
+        for item in items:
+            idx = product_col_idx.get(item.product_name)
+            if idx is None:
+                continue
+            cell = WriteOnlyCell(ws, value=item.balance)
+            apply_currency_display_format(cell, item.currency)
+            row[idx] = cell
+        ws.append(row)
 
 
-def export_to_excel(data: ExportExcelData) -> bytes:
+def export_to_excel(data: ExportExcelData) -> BytesIO:
     sheet_names = ["Institutions", "Products"] + [item.name for item in data.institutions]
     cx = create_workbook_with_sheets(sheet_names)
     _institution_to_sheet(data.institutions, cx.sheets["Institutions"])
@@ -129,9 +131,10 @@ def export_to_excel(data: ExportExcelData) -> bytes:
     for item in data.institutions:
         inst_product = inst_products[item.name]
         products_name = [product.name for product in inst_product]
+        products_by_id = {product.id: product for product in inst_product}
         balances: List[ExportBalanceItem] = []
         for balance in item.balances:
-            product = next((p for p in inst_product if p.id == balance.product_id), None)
+            product = products_by_id.get(balance.product_id)
             if product:
                 balances.append(
                     ExportBalanceItem(
@@ -145,4 +148,7 @@ def export_to_excel(data: ExportExcelData) -> bytes:
 
     output = BytesIO()
     cx.workbook.save(output)
-    return output.getvalue()
+    # Hand back the buffer itself so callers can stream it without another
+    # full copy of the workbook bytes.
+    output.seek(0)
+    return output
@@ -1,24 +1,166 @@
 from __future__ import annotations
 
+import json
 import os
 import shutil
+import sqlite3
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Protocol
 
 from fastapi import HTTPException, UploadFile
 
 
-_TASKS: Dict[str, Dict[str, Any]] = {}
-_LOCK = Lock()
+TASK_STORE_BACKEND = os.getenv("TASK_STORE_BACKEND", "memory").lower()
+TASK_STORE_SQLITE_PATH = os.getenv("TASK_STORE_SQLITE_PATH", "./tmp/import_tasks.sqlite3")
+TASK_TTL_SECONDS = int(os.getenv("TASK_TTL_SECONDS", "86400"))
 
 
 def _now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _new_task(task_id: str, kind: str, filename: str, size: int, owner_id: Optional[int]) -> Dict[str, Any]:
+    now = _now()
+    return {
+        "task_id": task_id,
+        "kind": kind,
+        "status": "queued",
+        "progress": 0,
+        "stage": "queued",
+        "filename": filename,
+        "size": size,
+        "owner_id": owner_id,
+        "result": None,
+        "error": None,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+class TaskStore(Protocol):
+    def create(self, task: Dict[str, Any]) -> None: ...
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]: ...
+
+    def update(self, task_id: str, updates: Dict[str, Any]) -> None: ...
+
+
+class InProcessTaskStore:
+    """Dict-backed store; only valid for single-worker deployments and tests."""
+
+    def __init__(self) -> None:
+        self._tasks: Dict[str, Dict[str, Any]] = {}
+        self._lock = Lock()
+
+    def create(self, task: Dict[str, Any]) -> None:
+        with self._lock:
+            self._tasks[task["task_id"]] = task
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            task = self._tasks.get(task_id)
+            return dict(task) if task else None
+
+    def update(self, task_id: str, updates: Dict[str, Any]) -> None:
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if not task:
+                return
+            task.update(updates)
+            task["updated_at"] = _now()
+
+
+class SQLiteTaskStore:
+    """SQLite-backed store shared across Uvicorn workers, with TTL eviction.
+
+    Tasks are serialized as JSON (datetimes as ISO strings); rows whose
+    updated_at falls outside TASK_TTL_SECONDS are swept on each create, so
+    the table stays bounded without a background reaper.
+    """
+
+    def __init__(self, path: str) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = Lock()
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS import_tasks ("
+                "task_id TEXT PRIMARY KEY, payload TEXT NOT NULL, updated_at TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_import_tasks_updated_at ON import_tasks (updated_at)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def _dump(task: Dict[str, Any]) -> str:
+        payload = dict(task)
+        for key in ("created_at", "updated_at"):
+            if isinstance(payload.get(key), datetime):
+                payload[key] = payload[key].isoformat()
+        return json.dumps(payload)
+
+    @staticmethod
+    def _load(raw: str) -> Dict[str, Any]:
+        task = json.loads(raw)
+        for key in ("created_at", "updated_at"):
+            if isinstance(task.get(key), str):
+                task[key] = datetime.fromisoformat(task[key])
+        return task
+
+    def _evict_expired(self) -> None:
+        cutoff = datetime.fromtimestamp(_now().timestamp() - TASK_TTL_SECONDS, tz=timezone.utc)
+        self._conn.execute(
+            "DELETE FROM import_tasks WHERE updated_at < ?", (cutoff.isoformat(),)
+        )
+
+    def create(self, task: Dict[str, Any]) -> None:
+        with self._lock:
+            self._evict_expired()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO import_tasks (task_id, payload, updated_at) VALUES (?, ?, ?)",
+                (task["task_id"], self._dump(task), task["updated_at"].isoformat()),
+            )
+            self._conn.commit()
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM import_tasks WHERE task_id = ?", (task_id,)
+            ).fetchone()
+        return self._load(row[0]) if row else None
+
+    def update(self, task_id: str, updates: Dict[str, Any]) -> None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM import_tasks WHERE task_id = ?", (task_id,)
+            ).fetchone()
+            if not row:
+                return
+            task = self._load(row[0])
+            task.update(updates)
+            task["updated_at"] = _now()
+            self._conn.execute(
+                "UPDATE import_tasks SET payload = ?, updated_at = ? WHERE task_id = ?",
+                (self._dump(task), task["updated_at"].isoformat(), task_id),
+            )
+            self._conn.commit()
+
+
+def _build_store() -> TaskStore:
+    if TASK_STORE_BACKEND == "sqlite":
+        return SQLiteTaskStore(TASK_STORE_SQLITE_PATH)
+    if TASK_STORE_BACKEND == "memory":
+        return InProcessTaskStore()
+    raise RuntimeError(f"unsupported TASK_STORE_BACKEND: {TASK_STORE_BACKEND}")
+
+
+_STORE: TaskStore = _build_store()
+
+
 def get_upload_dir() -> Path:
     root = os.getenv("UPLOAD_DIR", "./tmp/uploads")
     path = Path(root)
@@ -41,37 +183,13 @@ def save_upload_file(upload: UploadFile) -> Path:
 
 def create_task(kind: str, filename: str, size: int, owner_id: Optional[int] = None) -> str:
     task_id = str(uuid.uuid4())
-    now = _now()
-    task = {
-        "task_id": task_id,
-        "kind": kind,
-        "status": "queued",
-        "progress": 0,
-        "stage": "queued",
-        "filename": filename,
-        "size": size,
-        "owner_id": owner_id,
-        "result": None,
-        "error": None,
-        "created_at": now,
-        "updated_at": now,
-    }
-    with _LOCK:
-        _TASKS[task_id] = task
+    _STORE.create(_new_task(task_id, kind, filename, size, owner_id))
     return task_id
 
 
 def get_task(task_id: str) -> Optional[Dict[str, Any]]:
-    with _LOCK:
-        task = _TASKS.get(task_id)
-        return dict(task) if task else None
+    return _STORE.get(task_id)
 
 
 def update_task(task_id: str, **updates: Any) -> None:
-    with _LOCK:
-        task = _TASKS.get(task_id)
-        if not task:
-            return
-        task.update(updates)
-        task["updated_at"] = _now()
-
+    _STORE.update(task_id, updates)
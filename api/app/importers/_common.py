@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import sys
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List
+
+from fastapi import HTTPException
+
+
+def read_sheet_rows(
+    row_iter: Iterator[tuple],
+    required_headers: tuple[str, ...],
+    optional_headers: tuple[str, ...] = (),
+) -> List[Dict[str, Any]]:
+    """Map a header-led row stream to dicts keyed by the expected headers.
+
+    Shared by every importer so the hot row loop exists exactly once:
+    wanted columns are sliced with a prebound itemgetter, short rows are
+    padded up front, and the blank-row check only looks at ingested
+    columns. Missing required headers raise the usual 422.
+    """
+    header_row = next(row_iter, ())
+    header_map = {sys.intern(str(h).strip()): idx for idx, h in enumerate(header_row) if h is not None}
+    missing = [h for h in required_headers if h not in header_map]
+    if missing:
+        missing_list = ",".join(missing)
+        raise HTTPException(status_code=422, detail=f"missing_headers:{missing_list}")
+
+    keys = required_headers + tuple(h for h in optional_headers if h in header_map)
+    col_indices = tuple(header_map[key] for key in keys)
+    getter = itemgetter(*col_indices)
+    max_idx = max(col_indices)
+    rows: List[Dict[str, Any]] = []
+    for row in row_iter:
+        if len(row) <= max_idx:
+            row = row + (None,) * (max_idx + 1 - len(row))
+        values = getter(row) if len(col_indices) > 1 else (row[col_indices[0]],)
+        if not any(
+            cell is not None and (not isinstance(cell, str) or cell.strip())
+            for cell in values
+        ):
+            continue
+        rows.append(dict(zip(keys, values)))
+    return rows
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import sys
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import Any, Optional
+
+# Cell normalizers shared by the import parsers. These run O(rows x cols)
+# times, so each one fast-paths the exact types the streaming reader emits
+# (str/int/float/datetime) with type() identity checks before falling back
+# to the tolerant isinstance/try-except handling for subclasses and junk.
+
+
+def normalize_str(value: Any) -> Optional[str]:
+    # Interning dedupes the low-cardinality category/currency strings that
+    # repeat on every row, so downstream comparisons are pointer checks.
+    if type(value) is str:
+        text = value.strip()
+        return sys.intern(text) if text else None
+    if value is None:
+        return None
+    text = str(value).strip()
+    return sys.intern(text) if text else None
+
+
+# Amounts and rates repeat heavily in real files; memoizing the string ->
+# Decimal conversion skips the parse (and the allocation) for repeats.
+# Callers clear this when a parse finishes so memory stays bounded.
+@lru_cache(maxsize=4096)
+def _decimal_from_str(text: str) -> Optional[Decimal]:
+    try:
+        return Decimal(text)
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def clear_caches() -> None:
+    _decimal_from_str.cache_clear()
+
+
+def normalize_decimal(value: Any) -> Optional[Decimal]:
+    t = type(value)
+    if t is Decimal:
+        return value
+    if t is int:
+        return Decimal(value)
+    if t is float:
+        # repr() keeps the shortest round-trip form, avoiding float noise
+        # like Decimal(0.1)'s 55-digit expansion.
+        return _decimal_from_str(repr(value))
+    if value is None or value == "":
+        return None
+    return _decimal_from_str(value if t is str else str(value))
+
+
+def normalize_datetime(value: Any) -> Optional[datetime]:
+    t = type(value)
+    if t is datetime:
+        return value
+    if t is date:
+        return datetime(value.year, value.month, value.day)
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    return None
+
+
+def normalize_date(value: Any) -> Optional[date]:
+    t = type(value)
+    if t is datetime:
+        return value.date()
+    if t is date:
+        return value
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value).strip())
+    except ValueError:
+        return None
+
+
+def normalize_enum(value: Any) -> Optional[str]:
+    text = normalize_str(value)
+    return text.lower() if text else None
+
+
+def normalize_currency(value: Any) -> Optional[str]:
+    text = normalize_str(value)
+    return text.upper() if text else None
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import re
+import zipfile
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional
+from xml.etree.ElementTree import iterparse
+
+# Minimal streaming XLSX reader for the import hot path. openpyxl (even in
+# read-only mode) still resolves styles and wraps every value; for pure
+# ingest we only need shared strings, the date-format flag per cell style,
+# and the row stream, so this reads the sheet XML directly via iterparse
+# with elem.clear() after each row to keep memory bounded.
+
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_ATTR = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+_PKG_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# Excel's 1900 date system epoch (accounting for the leap-year bug offset),
+# and the 1904 epoch used by workbooks saved with workbookPr date1904.
+_EXCEL_EPOCH = datetime(1899, 12, 30)
+_EXCEL_EPOCH_1904 = datetime(1904, 1, 1)
+
+# Built-in numFmtIds that render as dates/times.
+_BUILTIN_DATE_FORMAT_IDS = frozenset(range(14, 23)) | frozenset(range(45, 48))
+
+# Literal sections ("...", [...] and escaped chars) carry no format tokens.
+_FORMAT_LITERAL_RE = re.compile(r'"[^"]*"|\[[^\]]*\]|\\.')
+_DATE_TOKEN_RE = re.compile(r"[dmhysDMHYS]")
+
+
+def _is_date_format(fmt_id: int, fmt_code: Optional[str]) -> bool:
+    if fmt_id in _BUILTIN_DATE_FORMAT_IDS:
+        return True
+    if fmt_code is None:
+        return False
+    return bool(_DATE_TOKEN_RE.search(_FORMAT_LITERAL_RE.sub("", fmt_code)))
+
+
+def _column_index(ref: str) -> int:
+    """0-based column index from a cell reference like 'BA17'."""
+    index = 0
+    for ch in ref:
+        if not ch.isalpha():
+            break
+        index = index * 26 + (ord(ch.upper()) - 64)
+    return index - 1
+
+
+def _excel_number(text: str) -> Any:
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _string_item_text(elem) -> str:
+    """Cell text from an <si> or <is> element.
+
+    Only direct <t> children and <t> inside <r> runs count; <rPh>
+    phonetic runs (furigana/pinyin annotations from East Asian Excel)
+    also contain <t> but are not part of the cell value.
+    """
+    parts: List[str] = []
+    for child in elem:
+        if child.tag == f"{_MAIN_NS}t":
+            parts.append(child.text or "")
+        elif child.tag == f"{_MAIN_NS}r":
+            t = child.find(f"{_MAIN_NS}t")
+            if t is not None:
+                parts.append(t.text or "")
+    return "".join(parts)
+
+
+class XlsxStreamReader:
+    """SAX-style reader over an .xlsx archive yielding value rows per sheet."""
+
+    def __init__(self, source: Any) -> None:
+        try:
+            self._zip = zipfile.ZipFile(source)
+        except zipfile.BadZipFile as exc:
+            raise ValueError("invalid_xlsx") from exc
+        try:
+            self._date1904 = False
+            self._sheet_targets = self._read_sheet_targets()
+            self._epoch = _EXCEL_EPOCH_1904 if self._date1904 else _EXCEL_EPOCH
+            self._shared_strings = self._read_shared_strings()
+            self._date_styles = self._read_date_styles()
+        except Exception:
+            self._zip.close()
+            raise
+
+    # -- workbook structure ------------------------------------------------
+
+    def _read_sheet_targets(self) -> Dict[str, str]:
+        rel_targets: Dict[str, str] = {}
+        try:
+            with self._zip.open("xl/_rels/workbook.xml.rels") as fh:
+                for _, elem in iterparse(fh, events=("end",)):
+                    if elem.tag == f"{_PKG_NS}Relationship":
+                        target = elem.get("Target", "")
+                        if target.startswith("/"):
+                            target = target[1:]
+                        else:
+                            target = f"xl/{target}"
+                        rel_targets[elem.get("Id", "")] = target
+                    elem.clear()
+        except KeyError as exc:
+            raise ValueError("invalid_xlsx") from exc
+
+        targets: Dict[str, str] = {}
+        with self._zip.open("xl/workbook.xml") as fh:
+            for _, elem in iterparse(fh, events=("end",)):
+                if elem.tag == f"{_MAIN_NS}sheet":
+                    rel_id = elem.get(_REL_ATTR, "")
+                    if rel_id in rel_targets:
+                        targets[elem.get("name", "")] = rel_targets[rel_id]
+                elif elem.tag == f"{_MAIN_NS}workbookPr":
+                    # Mac-origin workbooks count serials from 1904-01-01.
+                    self._date1904 = elem.get("date1904", "false").lower() in ("1", "true")
+                elem.clear()
+        return targets
+
+    def _read_shared_strings(self) -> List[str]:
+        strings: List[str] = []
+        if "xl/sharedStrings.xml" not in self._zip.namelist():
+            return strings
+        with self._zip.open("xl/sharedStrings.xml") as fh:
+            for _, elem in iterparse(fh, events=("end",)):
+                if elem.tag == f"{_MAIN_NS}si":
+                    strings.append(_string_item_text(elem))
+                    elem.clear()
+        return strings
+
+    def _read_date_styles(self) -> List[bool]:
+        """date-format flag per cellXfs index (what a cell's s= refers to)."""
+        if "xl/styles.xml" not in self._zip.namelist():
+            return []
+        custom_formats: Dict[int, str] = {}
+        date_styles: List[bool] = []
+        with self._zip.open("xl/styles.xml") as fh:
+            in_cell_xfs = False
+            for event, elem in iterparse(fh, events=("start", "end")):
+                if event == "start":
+                    if elem.tag == f"{_MAIN_NS}cellXfs":
+                        in_cell_xfs = True
+                    continue
+                if elem.tag == f"{_MAIN_NS}numFmt":
+                    custom_formats[int(elem.get("numFmtId", "0"))] = elem.get("formatCode", "")
+                elif elem.tag == f"{_MAIN_NS}xf" and in_cell_xfs:
+                    fmt_id = int(elem.get("numFmtId", "0"))
+                    date_styles.append(_is_date_format(fmt_id, custom_formats.get(fmt_id)))
+                elif elem.tag == f"{_MAIN_NS}cellXfs":
+                    in_cell_xfs = False
+                elem.clear()
+        return date_styles
+
+    # -- public API --------------------------------------------------------
+
+    @property
+    def sheet_names(self) -> List[str]:
+        return list(self._sheet_targets)
+
+    def iter_rows(self, sheet_name: str) -> Iterator[tuple]:
+        target = self._sheet_targets.get(sheet_name)
+        if target is None:
+            raise KeyError(sheet_name)
+        with self._zip.open(target) as fh:
+            for _, elem in iterparse(fh, events=("end",)):
+                if elem.tag != f"{_MAIN_NS}row":
+                    continue
+                yield self._row_values(elem)
+                elem.clear()
+
+    def close(self) -> None:
+        self._zip.close()
+
+    def __enter__(self) -> "XlsxStreamReader":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    # -- cell decoding -----------------------------------------------------
+
+    def _row_values(self, row_elem) -> tuple:
+        values: List[Any] = []
+        for cell in row_elem:
+            if cell.tag != f"{_MAIN_NS}c":
+                continue
+            ref = cell.get("r")
+            if ref is not None:
+                col = _column_index(ref)
+                # Sparse rows omit empty cells; pad the gap with None.
+                while len(values) < col:
+                    values.append(None)
+            values.append(self._cell_value(cell))
+        return tuple(values)
+
+    def _cell_value(self, cell) -> Any:
+        cell_type = cell.get("t", "n")
+        if cell_type == "inlineStr":
+            is_elem = cell.find(f"{_MAIN_NS}is")
+            if is_elem is None:
+                return None
+            return _string_item_text(is_elem) or None
+        value_elem = cell.find(f"{_MAIN_NS}v")
+        if value_elem is None or value_elem.text is None:
+            return None
+        text = value_elem.text
+        if cell_type == "s":
+            return self._shared_strings[int(text)]
+        if cell_type == "str":
+            return text
+        if cell_type == "b":
+            return text == "1"
+        if cell_type == "e":
+            return None
+        if cell_type == "d":
+            return datetime.fromisoformat(text)
+        number = _excel_number(text)
+        style = int(cell.get("s", "0"))
+        if style < len(self._date_styles) and self._date_styles[style]:
+            return self._epoch + timedelta(days=number)
+        return number
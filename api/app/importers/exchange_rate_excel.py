@@ -1,119 +1,87 @@
 from __future__ import annotations
 
-from datetime import date, datetime
-from decimal import Decimal, InvalidOperation
+import sys
 from io import BytesIO
-from typing import Any, Dict, List, Optional
+from typing import Any
 
 from pathlib import Path
 
+import anyio
 from fastapi import HTTPException, UploadFile
-from openpyxl import load_workbook
-from pydantic import ValidationError
-
-from ..schemas.exchange_rate_import import (
-    ImportExchangeRateItem,
-    ImportExchangeRateRequest,
+from pydantic import TypeAdapter, ValidationError
+
+from ._common import read_sheet_rows as _read_sheet_rows
+from ._normalize import (
+    clear_caches as _clear_normalize_caches,
+    normalize_date as _normalize_date,
+    normalize_decimal as _normalize_decimal,
+    normalize_str as _normalize_str,
 )
+from ._xlsx_stream import XlsxStreamReader
 
+from ..schemas.exchange_rate_import import ImportExchangeRateRequest
 
-def _normalize_str(value: Any) -> Optional[str]:
-    if value is None:
-        return None
-    text = str(value).strip()
-    return text or None
+# One compiled validator for the entire request: pydantic-core builds the
+# schema at import time and each parse is a single validate_python call.
+_REQUEST_ADAPTER = TypeAdapter(ImportExchangeRateRequest)
 
+# Sheet schema, hoisted so each parse reuses the same interned tuples;
+# header lookups then hit cached hashes/pointer-equal strings.
+_REQUIRED_HEADERS = tuple(sys.intern(h) for h in ("base", "quote", "rate_date", "rate"))
+_OPTIONAL_HEADERS = (sys.intern("source"),)
 
-def _normalize_decimal(value: Any) -> Optional[Decimal]:
-    if value is None or value == "":
-        return None
-    if isinstance(value, Decimal):
-        return value
-    try:
-        return Decimal(str(value))
-    except (InvalidOperation, ValueError):
-        return None
-
-
-def _normalize_date(value: Any) -> Optional[date]:
-    if isinstance(value, datetime):
-        return value.date()
-    if isinstance(value, date):
-        return value
-    if value is None or value == "":
-        return None
-    try:
-        return date.fromisoformat(str(value).strip())
-    except ValueError:
-        return None
-
-
-def _read_sheet_rows(
-    ws,
-    required_headers: List[str],
-    optional_headers: List[str],
-) -> List[Dict[str, Any]]:
-    header_row = [cell.value for cell in ws[1]]
-    header_map = {str(h).strip(): idx for idx, h in enumerate(header_row) if h is not None}
-    missing = [h for h in required_headers if h not in header_map]
-    if missing:
-        missing_list = ",".join(missing)
-        raise HTTPException(status_code=422, detail=f"missing_headers:{missing_list}")
-
-    keys = required_headers + [h for h in optional_headers if h in header_map]
-    rows: List[Dict[str, Any]] = []
-    for row in ws.iter_rows(min_row=2, values_only=True):
-        if all(cell is None or str(cell).strip() == "" for cell in row):
-            continue
-        item: Dict[str, Any] = {}
-        for key in keys:
-            idx = header_map[key]
-            item[key] = row[idx] if idx < len(row) else None
-        rows.append(item)
-    return rows
-
-
-def _parse_exchange_rate_import_content(filename: str, content: bytes) -> ImportExchangeRateRequest:
-    if not filename or not filename.lower().endswith(".xlsx"):
+
+def _parse_exchange_rate_import_content(filename: str, source: Any) -> ImportExchangeRateRequest:
+    """Parse an .xlsx exchange-rate import from a path or file-like object."""
+    # Lowercase only the extension instead of copying the whole filename.
+    if len(filename) < 5 or filename[-5:].lower() != ".xlsx":
         raise HTTPException(status_code=422, detail="invalid_file_type")
 
     try:
-        wb = load_workbook(BytesIO(content), data_only=True)
+        # The streaming reader parses only shared strings, the date-style
+        # table and the raw row stream - no cell objects, no style resolution.
+        reader = XlsxStreamReader(source)
     except Exception as exc:
         raise HTTPException(status_code=422, detail="invalid_excel") from exc
 
-    if "exchange_rates" not in wb.sheetnames:
-        raise HTTPException(status_code=422, detail="missing_sheet:exchange_rates")
-
-    rows = _read_sheet_rows(
-        wb["exchange_rates"],
-        ["base", "quote", "rate_date", "rate"],
-        ["source"],
-    )
+    try:
+        if "exchange_rates" not in reader.sheet_names:
+            raise HTTPException(status_code=422, detail="missing_sheet:exchange_rates")
 
-    items: List[ImportExchangeRateItem] = []
-    for row in rows:
-        items.append(
-            ImportExchangeRateItem(
-                base=_normalize_str(row["base"]),
-                quote=_normalize_str(row["quote"]),
-                rate_date=_normalize_date(row["rate_date"]),
-                rate=_normalize_decimal(row["rate"]),
-                source=_normalize_str(row.get("source")),
-            )
+        rows = _read_sheet_rows(
+            reader.iter_rows("exchange_rates"), _REQUIRED_HEADERS, _OPTIONAL_HEADERS
         )
+    finally:
+        reader.close()
+        _clear_normalize_caches()
+
+    item_dicts = [
+        {
+            "base": _normalize_str(row["base"]),
+            "quote": _normalize_str(row["quote"]),
+            "rate_date": _normalize_date(row["rate_date"]),
+            "rate": _normalize_decimal(row["rate"]),
+            "source": _normalize_str(row.get("source")),
+        }
+        for row in rows
+    ]
 
     try:
-        return ImportExchangeRateRequest(items=items)
+        return _REQUEST_ADAPTER.validate_python({"items": item_dicts})
     except ValidationError as exc:
         raise HTTPException(status_code=422, detail=exc.errors()) from exc
 
 
-def parse_exchange_rate_import_file(upload: UploadFile) -> ImportExchangeRateRequest:
-    content = upload.file.read()
-    return _parse_exchange_rate_import_content(upload.filename or "", content)
+async def parse_exchange_rate_import_file(upload: UploadFile) -> ImportExchangeRateRequest:
+    # Read the upload through starlette's async API so the event loop is
+    # never blocked, then push the CPU-bound parse onto a worker thread.
+    content = await upload.read()
+    return await anyio.to_thread.run_sync(
+        _parse_exchange_rate_import_content, upload.filename or "", BytesIO(content)
+    )
 
 
 def parse_exchange_rate_import_path(path: Path) -> ImportExchangeRateRequest:
-    content = path.read_bytes()
-    return _parse_exchange_rate_import_content(path.name, content)
+    # Let openpyxl stream the file from disk rather than copying it into
+    # memory first.
+    return _parse_exchange_rate_import_content(path.name, path)
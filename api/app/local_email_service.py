@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import atexit
 import os
-from urllib.parse import urlencode
+import queue
+import threading
+from urllib.parse import quote
 
 from fastapi import HTTPException
 
@@ -11,18 +14,107 @@ PASSWORD_RESET_URL = os.getenv("PASSWORD_RESET_URL", "http://localhost:3000/rese
 EMAIL_VERIFICATION_URL = os.getenv("EMAIL_VERIFICATION_URL", "http://localhost:3000/verify-email")
 LOCAL_EMAIL_STORE_PATH = os.getenv("LOCAL_EMAIL_STORE_PATH", "/data/local_emails.log")
 
+# Messages are appended by a single daemon thread over one buffered handle
+# instead of an open/write/close per send, keeping the syscall cost off the
+# request path. If the queue ever fills, the caller falls back to a
+# synchronous write so no message is dropped.
+_QUEUE_MAX = 10_000
+_WRITE_BATCH_MAX = 256
+
+_queue: queue.Queue[str] = queue.Queue(maxsize=_QUEUE_MAX)
+_writer_lock = threading.Lock()
+_writer_thread: threading.Thread | None = None
+_handle = None
+
 
 def _build_link(base_url: str, token: str) -> str:
     sep = "&" if "?" in base_url else "?"
-    return f"{base_url}{sep}{urlencode({'token': token})}"
+    # Tokens are the only parameter; quote() them directly instead of
+    # paying urlencode's dict walk per link.
+    return f"{base_url}{sep}token={quote(token, safe='')}"
+
+
+def _write_records(records: list[str]) -> None:
+    global _handle
+    with _writer_lock:
+        if _handle is None:
+            _handle = open(LOCAL_EMAIL_STORE_PATH, "a", encoding="utf-8", buffering=64 * 1024)
+        _handle.write("".join(records))
+        _handle.flush()
+
+
+def _close_handle() -> None:
+    global _handle
+    with _writer_lock:
+        try:
+            if _handle is not None:
+                _handle.close()
+        except Exception:  # noqa: BLE001
+            pass
+        _handle = None
+
+
+def _drain() -> None:
+    while True:
+        records = [_queue.get()]
+        while len(records) < _WRITE_BATCH_MAX:
+            try:
+                records.append(_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            _write_records(records)
+        except Exception:  # noqa: BLE001
+            # Drop the handle so the next batch reopens it; under I/O failure
+            # the batch is lost, same best-effort outcome as the old
+            # append-per-send (minus a 500 on the request).
+            _close_handle()
+        finally:
+            for _ in records:
+                _queue.task_done()
+
+
+def _ensure_writer() -> None:
+    global _writer_thread
+    if _writer_thread is not None and _writer_thread.is_alive():
+        return
+    with _writer_lock:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(
+                target=_drain, name="local-email-writer", daemon=True
+            )
+            _writer_thread.start()
+
+
+def _flush_and_close() -> None:
+    records: list[str] = []
+    while True:
+        try:
+            records.append(_queue.get_nowait())
+        except queue.Empty:
+            break
+    try:
+        if records:
+            _write_records(records)
+    except Exception:  # noqa: BLE001
+        pass
+    _close_handle()
+
+
+atexit.register(_flush_and_close)
 
 
 def _persist_message(subject: str, to_email: str, link: str) -> None:
+    record = f"TO={to_email}\nSUBJECT={subject}\nLINK={link}\n---\n"
+    _ensure_writer()
     try:
-        with open(LOCAL_EMAIL_STORE_PATH, "a", encoding="utf-8") as handle:
-            handle.write(f"TO={to_email}\nSUBJECT={subject}\nLINK={link}\n---\n")
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail="local_email_persist_failed") from exc
+        _queue.put_nowait(record)
+    except queue.Full:
+        # Backpressure: write synchronously rather than dropping the message.
+        try:
+            _write_records([record])
+        except Exception as exc:  # noqa: BLE001
+            raise HTTPException(status_code=500, detail="local_email_persist_failed") from exc
 
 
 def send_verification_email(to_email: str, token: str) -> None:
@@ -1,12 +1,28 @@
+import importlib
+import os
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
-from .routers import currency, custom, deposit, expense, file, user, scheduler
+from sqlalchemy.orm import configure_mappers
 
 
 # Load environment variables from .env if present
 load_dotenv()
 
-app = FastAPI(title="Flow-Ledger API (Baseline)")
+# orjson serializes the dict-shaped responses (currency pages, rate
+# ranges) several times faster than the stdlib encoder.
+app = FastAPI(title="Flow-Ledger API (Baseline)", default_response_class=ORJSONResponse)
+
+# Router modules pull in the heavy transitive imports (SQLAlchemy models,
+# Pydantic schemas, openpyxl). With LAZY_ROUTER_STARTUP=true they load in
+# the startup hook instead of at process import, which trims module import
+# time for dev-reload and serverless-style cold starts. Default stays
+# eager: TestClient-style consumers that skip the lifespan still see all
+# routes, and uvicorn waits for startup before serving either way.
+LAZY_ROUTER_STARTUP = os.getenv("LAZY_ROUTER_STARTUP", "false").lower() == "true"
+
+_ROUTER_MODULES = ("currency", "custom", "user", "expense", "deposit", "file", "scheduler")
 
 
 @app.get("/v1/healthz")
@@ -14,10 +30,18 @@ def healthz():
     return {"ok": True}
 
 
-app.include_router(currency.router)
-app.include_router(custom.router)
-app.include_router(user.router)
-app.include_router(expense.router)
-app.include_router(deposit.router)
-app.include_router(file.router)
-app.include_router(scheduler.router)
+def _include_routers() -> None:
+    for name in _ROUTER_MODULES:
+        module = importlib.import_module(f".routers.{name}", __package__)
+        app.include_router(module.router)
+    # The routers pull in every mapped class; configuring the mappers here
+    # moves that one-time cost off the first query of the first request.
+    configure_mappers()
+
+
+if LAZY_ROUTER_STARTUP:
+    @app.on_event("startup")
+    async def _load_routers() -> None:
+        _include_routers()
+else:
+    _include_routers()
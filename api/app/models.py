@@ -11,16 +11,22 @@ from sqlalchemy import (
     String,
     Integer,
     BigInteger,
+    SmallInteger,
     Boolean,
     ForeignKey,
     UniqueConstraint,
     JSON,
 )
-from sqlalchemy import Index
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Index, desc, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from .db import Base
 
 
+
+# Shared BIGINT-with-sqlite-variant id type; one instance serves every
+# model instead of each class building its own at import time.
+_ID_TYPE = BigInteger().with_variant(Integer, "sqlite")
+
 class Currency(Base):
     __tablename__ = "currencies"
     __table_args__ = (
@@ -30,7 +36,8 @@ class Currency(Base):
     code: Mapped[str] = mapped_column(String, primary_key=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
     symbol: Mapped[str | None] = mapped_column(String, nullable=True)
-    scale: Mapped[int] = mapped_column(Integer, nullable=False, default=2)
+    # Holds 0-10; SMALLINT halves the column width on a hot lookup table.
+    scale: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=2)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
@@ -39,7 +46,17 @@ class ExchangeRate(Base):
     __tablename__ = "exchange_rates"
     __table_args__ = (
         CheckConstraint("rate > 0", name="ck_exchange_rates__positive"),
-        Index("idx_exchange_rates__pair_date_desc", "base_code", "quote_code", "rate_date"),
+        # DESC ordering lets "latest rate for pair" walk the index forward,
+        # and including rate makes the lookup an index-only scan on Postgres.
+        # Deployed by sql/schema/currency.sql, which also drops the old
+        # non-covering idx_exchange_rates__pair_date_desc.
+        Index(
+            "idx_exchange_rates__pair_date_rate",
+            "base_code",
+            "quote_code",
+            desc("rate_date"),
+            postgresql_include=["rate"],
+        ),
         {"schema": "currency"},
     )
 
@@ -47,7 +64,9 @@ class ExchangeRate(Base):
     base_code: Mapped[str] = mapped_column(String, nullable=False)
     quote_code: Mapped[str] = mapped_column(String, nullable=False)
     rate_date: Mapped[date] = mapped_column(Date, nullable=False)
-    rate: Mapped[float] = mapped_column(Numeric(20, 10), nullable=False)
+    # asdecimal=False keeps the exact NUMERIC storage but hands Python a
+    # float64, skipping a Decimal allocation per row on the read paths.
+    rate: Mapped[float] = mapped_column(Numeric(20, 10, asdecimal=False), nullable=False)
     source: Mapped[str | None] = mapped_column(String, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -63,7 +82,7 @@ class User(Base):
         {"schema": "user"},
     )
 
-    _id_type = BigInteger().with_variant(Integer, "sqlite")
+    _id_type = _ID_TYPE
 
     id: Mapped[int] = mapped_column(_id_type, primary_key=True, autoincrement=True)
     username: Mapped[str | None] = mapped_column(String, nullable=True)
@@ -85,6 +104,10 @@ class User(Base):
     def email_verified(self) -> bool:
         return self.email_verified_at is not None
 
+    # One-to-one preference row; loaded explicitly (joinedload) by the
+    # auth dependency, lazy="raise" blocks accidental per-request SELECTs.
+    preference: Mapped["UserPreference | None"] = relationship(lazy="raise", uselist=False)
+
 
 class UserPreference(Base):
     __tablename__ = "user_prefs"
@@ -92,7 +115,7 @@ class UserPreference(Base):
         {"schema": "user"},
     )
 
-    _id_type = BigInteger().with_variant(Integer, "sqlite")
+    _id_type = _ID_TYPE
 
     id: Mapped[int] = mapped_column(_id_type, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
@@ -120,7 +143,7 @@ class AuthToken(Base):
         {"schema": "user"},
     )
 
-    _id_type = BigInteger().with_variant(Integer, "sqlite")
+    _id_type = _ID_TYPE
 
     id: Mapped[int] = mapped_column(_id_type, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
@@ -144,7 +167,7 @@ class ExpenseCategory(Base):
         {"schema": "expense"},
     )
 
-    _id_type = BigInteger().with_variant(Integer, "sqlite")
+    _id_type = _ID_TYPE
 
     id: Mapped[int] = mapped_column(_id_type, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
@@ -157,15 +180,24 @@ class ExpenseCategory(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
+    # lazy="raise" turns any implicit per-row load into an error; callers
+    # that need the collection must opt in with selectinload at query time.
+    expenses: Mapped[list["Expense"]] = relationship(
+        back_populates="category", lazy="raise"
+    )
+
 
 class Expense(Base):
     __tablename__ = "expenses"
     __table_args__ = (
         CheckConstraint("amount >= 0", name="ck_expenses__amount_positive"),
+        # Mirrors the index deployed by sql/schema/expense.sql.
+        Index("idx_expenses__user_occurred_at_desc", "user_id", desc("occurred_at")),
+        Index("idx_expenses__user_category", "user_id", "category_id"),
         {"schema": "expense"},
     )
 
-    _id_type = BigInteger().with_variant(Integer, "sqlite")
+    _id_type = _ID_TYPE
 
     id: Mapped[int] = mapped_column(_id_type, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
@@ -194,6 +226,14 @@ class Expense(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
+    # Guard-rail relationships (see ExpenseCategory.expenses): accessing
+    # them without an explicit loader option raises instead of issuing a
+    # silent N+1 SELECT per row.
+    category: Mapped["ExpenseCategory | None"] = relationship(
+        back_populates="expenses", lazy="raise"
+    )
+    user: Mapped["User"] = relationship(lazy="raise")
+
 
 class SchedulerJob(Base):
     __tablename__ = "jobs"
@@ -204,7 +244,7 @@ class SchedulerJob(Base):
         {"schema": "scheduler"},
     )
 
-    _id_type = BigInteger().with_variant(Integer, "sqlite")
+    _id_type = _ID_TYPE
 
     id: Mapped[int] = mapped_column(_id_type, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
@@ -232,10 +272,17 @@ class SchedulerJobRun(Base):
             name="ck_job_runs__status",
         ),
         Index("idx_job_runs__job_scheduled", "job_id", "scheduled_at"),
+        # Partial index keeps the scheduler's work-queue scan over pending
+        # runs small no matter how much history the table accumulates.
+        Index(
+            "idx_job_runs__pending",
+            "scheduled_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
         {"schema": "scheduler"},
     )
 
-    _id_type = BigInteger().with_variant(Integer, "sqlite")
+    _id_type = _ID_TYPE
 
     id: Mapped[int] = mapped_column(_id_type, primary_key=True, autoincrement=True)
     job_id: Mapped[int] = mapped_column(
@@ -257,7 +304,7 @@ class SchedulerReminder(Base):
         {"schema": "scheduler"},
     )
 
-    _id_type = BigInteger().with_variant(Integer, "sqlite")
+    _id_type = _ID_TYPE
 
     id: Mapped[int] = mapped_column(_id_type, primary_key=True, autoincrement=True)
     job_run_id: Mapped[int] = mapped_column(
@@ -283,7 +330,7 @@ class SchedulerConfirmation(Base):
         {"schema": "scheduler"},
     )
 
-    _id_type = BigInteger().with_variant(Integer, "sqlite")
+    _id_type = _ID_TYPE
 
     id: Mapped[int] = mapped_column(_id_type, primary_key=True, autoincrement=True)
     job_run_id: Mapped[int] = mapped_column(
@@ -306,7 +353,7 @@ class Institution(Base):
         {"schema": "deposit"},
     )
 
-    _id_type = BigInteger().with_variant(Integer, "sqlite")
+    _id_type = _ID_TYPE
 
     id: Mapped[int] = mapped_column(_id_type, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
@@ -338,7 +385,7 @@ class FinancialProduct(Base):
         {"schema": "deposit"},
     )
 
-    _id_type = BigInteger().with_variant(Integer, "sqlite")
+    _id_type = _ID_TYPE
 
     id: Mapped[int] = mapped_column(_id_type, primary_key=True, autoincrement=True)
     institution_id: Mapped[int] = mapped_column(
@@ -364,7 +411,7 @@ class ProductBalance(Base):
         {"schema": "deposit"},
     )
 
-    _id_type = BigInteger().with_variant(Integer, "sqlite")
+    _id_type = _ID_TYPE
 
     id: Mapped[int] = mapped_column(_id_type, primary_key=True, autoincrement=True)
     product_id: Mapped[int] = mapped_column(
@@ -382,7 +429,7 @@ class FileAsset(Base):
         {"schema": "file"},
     )
 
-    _id_type = BigInteger().with_variant(Integer, "sqlite")
+    _id_type = _ID_TYPE
 
     id: Mapped[int] = mapped_column(_id_type, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
@@ -1,22 +1,235 @@
 from __future__ import annotations
 
-import base64
+import binascii
+import hashlib
 import json
 import logging
 import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 
+import anyio
+import asyncio
 import httpx
 
+try:  # optional: C-accelerated JSON for multi-MB OCR payloads
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - orjson is in requirements, but stay importable without it
+    _orjson = None
+
+try:  # optional: image downscaling before upload needs Pillow
+    from PIL import Image as _PILImage
+except ImportError:  # pragma: no cover - pillow is in requirements, but stay importable without it
+    _PILImage = None
+
+try:  # optional: local response validation needs jsonschema
+    from jsonschema import Draft202012Validator as _Draft202012Validator
+except ImportError:  # pragma: no cover - jsonschema is in requirements, but stay importable without it
+    _Draft202012Validator = None
+
+try:  # optional: SIMD base64 for the multi-MB image payloads
+    from pybase64 import b64encode as _b64encode
+except ImportError:  # pragma: no cover - pybase64 is in requirements, but stay importable without it
+    def _b64encode(data: bytes) -> bytes:
+        return binascii.b2a_base64(data, newline=False)
+
 logger = logging.getLogger(__name__)
 
+if _orjson is not None:
+    _json_loads = _orjson.loads
+    _json_dumps = _orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+# Full-resolution phone photos dominate OCR payload size (and token cost).
+# When enabled, images above the size floor are resampled to a bounded
+# longest edge and re-encoded as JPEG before the base64 step.
+OCR_RESIZE_ENABLED = os.getenv("OPENAI_OCR_RESIZE", "false").lower() in {"1", "true"}
+_OCR_RESIZE_MIN_BYTES = 200_000
+_OCR_RESIZE_MAX_EDGE = 1600
+_OCR_RESIZE_JPEG_QUALITY = 85
+
+# Shared client so repeated OCR calls reuse the same TCP/TLS connection
+# instead of handshaking per receipt. Created lazily on first use; the
+# per-call timeout still comes from the env settings.
+_client: Optional[httpx.Client] = None
+_async_client: Optional[httpx.AsyncClient] = None
+_client_lock = threading.Lock()
+
+# HTTP/2 lets concurrent OCR calls multiplex one TLS connection to the
+# upstream instead of paying a handshake per in-flight request; the long
+# keepalive expiry holds it open across the gaps between receipts.
+_CLIENT_LIMITS = httpx.Limits(
+    max_connections=32, max_keepalive_connections=32, keepalive_expiry=60
+)
+
+
+def _get_client() -> httpx.Client:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(http2=True, limits=_CLIENT_LIMITS)
+    return _client
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    global _async_client
+    if _async_client is None:
+        with _client_lock:
+            if _async_client is None:
+                _async_client = httpx.AsyncClient(http2=True, limits=_CLIENT_LIMITS)
+    return _async_client
+
 
 class ReceiptOcrError(RuntimeError):
     pass
 
 
+# Retried receipts are common (bot redelivery, user resubmits), and each
+# retry re-burns a ~20s upstream call. Parsed results are cached on disk
+# keyed by the image's SHA-256 plus model, category set and prompt date;
+# hashing the file is negligible next to the base64 encode. Any cache
+# failure degrades to a plain upstream call.
+OCR_CACHE_ENABLED = os.getenv("OPENAI_OCR_CACHE", "true").lower() in {"1", "true"}
+OCR_CACHE_PATH = os.getenv("OPENAI_OCR_CACHE_PATH", "/data/ocr_cache.sqlite3")
+# Result keys embed the UTC prompt date, so entries go permanently stale
+# after a day; rows older than the TTL are swept on each write, the same
+# scheme SQLiteTaskStore uses, so the file stays bounded without a reaper.
+OCR_CACHE_TTL_SECONDS = int(os.getenv("OPENAI_OCR_CACHE_TTL_SECONDS", "172800"))
+
+# Opt-in: upload each distinct image to the Files API once and reference
+# it by file_id, instead of re-sending a ~1.37x base64 data URL per call.
+# Uploaded ids are remembered per content digest in the same cache db.
+OCR_FILE_UPLOAD_ENABLED = os.getenv("OPENAI_OCR_FILE_UPLOAD", "false").lower() in {"1", "true"}
+OPENAI_FILES_URL = os.getenv("OPENAI_FILES_URL", "https://api.openai.com/v1/files")
+
+_cache_conn: Optional[sqlite3.Connection] = None
+_cache_failed = False
+_cache_lock = threading.Lock()
+
+
+def _cache_connection() -> Optional[sqlite3.Connection]:
+    global _cache_conn, _cache_failed
+    if not OCR_CACHE_ENABLED or _cache_failed:
+        return None
+    if _cache_conn is None:
+        with _cache_lock:
+            if _cache_conn is None and not _cache_failed:
+                try:
+                    conn = sqlite3.connect(OCR_CACHE_PATH, check_same_thread=False)
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS ocr_cache ("
+                        "key TEXT PRIMARY KEY, result TEXT NOT NULL, ts REAL NOT NULL)"
+                    )
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS ocr_files ("
+                        "digest TEXT PRIMARY KEY, file_id TEXT NOT NULL, ts REAL NOT NULL)"
+                    )
+                    conn.execute(
+                        "CREATE INDEX IF NOT EXISTS ix_ocr_cache_ts ON ocr_cache (ts)"
+                    )
+                    conn.commit()
+                    _cache_conn = conn
+                except Exception:  # noqa: BLE001 - run uncached rather than fail
+                    logger.warning("OCR cache unavailable at %s", OCR_CACHE_PATH, exc_info=True)
+                    _cache_failed = True
+    return _cache_conn
+
+
+def _file_sha256(image_path: Path) -> str:
+    with image_path.open("rb") as fh:
+        return hashlib.file_digest(fh, "sha256").hexdigest()
+
+
+def _image_cache_key(digest: str, model: str, categories: List[str]) -> str:
+    # The prompt embeds the UTC date, so the key does too: a hit always
+    # corresponds to a byte-identical upstream request.
+    date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    return f"{digest}:{model}:{','.join(sorted(categories))}:{date}"
+
+
+def _cache_get(key: str) -> Optional[Dict[str, Any]]:
+    conn = _cache_connection()
+    if conn is None:
+        return None
+    try:
+        with _cache_lock:
+            row = conn.execute(
+                "SELECT result FROM ocr_cache WHERE key = ?", (key,)
+            ).fetchone()
+    except Exception:  # noqa: BLE001 - a broken cache must never break OCR
+        return None
+    if row is None:
+        return None
+    try:
+        result = _json_loads(row[0])
+    except ValueError:
+        return None
+    return result if isinstance(result, dict) else None
+
+
+def _cached_file_id(digest: str) -> Optional[str]:
+    conn = _cache_connection()
+    if conn is None:
+        return None
+    try:
+        with _cache_lock:
+            row = conn.execute(
+                "SELECT file_id FROM ocr_files WHERE digest = ?", (digest,)
+            ).fetchone()
+    except Exception:  # noqa: BLE001
+        return None
+    return row[0] if row else None
+
+
+def _store_file_id(digest: str, file_id: str) -> None:
+    conn = _cache_connection()
+    if conn is None:
+        return
+    try:
+        with _cache_lock:
+            conn.execute(
+                "INSERT OR REPLACE INTO ocr_files (digest, file_id, ts) VALUES (?, ?, ?)",
+                (digest, file_id, time.time()),
+            )
+            conn.commit()
+    except Exception:  # noqa: BLE001
+        logger.warning("OCR file-id cache write failed", exc_info=True)
+
+
+def _cache_put(key: str, result: Dict[str, Any]) -> None:
+    conn = _cache_connection()
+    if conn is None:
+        return
+    try:
+        text = _json_dumps(result).decode("utf-8")
+        now = time.time()
+        with _cache_lock:
+            # ocr_files is left alone: one row per distinct image digest,
+            # and its entries stay reachable.
+            conn.execute(
+                "DELETE FROM ocr_cache WHERE ts < ?",
+                (now - OCR_CACHE_TTL_SECONDS,),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO ocr_cache (key, result, ts) VALUES (?, ?, ?)",
+                (key, text, now),
+            )
+            conn.commit()
+    except Exception:  # noqa: BLE001
+        logger.warning("OCR cache write failed", exc_info=True)
+
+
 def _load_openai_settings() -> tuple[str, str, str, float]:
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
@@ -27,49 +240,159 @@ def _load_openai_settings() -> tuple[str, str, str, float]:
     return api_key, model, api_url, timeout_seconds
 
 
+_MIME_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+}
+
+
 def _guess_mime_type(path: Path) -> str:
-    suffix = path.suffix.lower()
-    if suffix in {".jpg", ".jpeg"}:
-        return "image/jpeg"
-    if suffix == ".png":
-        return "image/png"
-    if suffix == ".webp":
-        return "image/webp"
-    if suffix == ".gif":
-        return "image/gif"
-    return "application/octet-stream"
+    return _MIME_TYPES.get(path.suffix.lower(), "application/octet-stream")
+
+
+def _downscaled_jpeg(image_path: Path) -> Optional[bytes]:
+    """Recompressed JPEG bytes, or None when preprocessing is skipped."""
+    if not OCR_RESIZE_ENABLED or _PILImage is None:
+        return None
+    try:
+        if image_path.stat().st_size < _OCR_RESIZE_MIN_BYTES:
+            return None
+        with _PILImage.open(image_path) as im:
+            im.thumbnail((_OCR_RESIZE_MAX_EDGE, _OCR_RESIZE_MAX_EDGE), _PILImage.LANCZOS)
+            out = BytesIO()
+            im.convert("RGB").save(
+                out, "JPEG", quality=_OCR_RESIZE_JPEG_QUALITY, optimize=True
+            )
+        return out.getvalue()
+    except Exception:  # noqa: BLE001 - fall back to the original image
+        logger.warning("receipt image downscale failed; sending original", exc_info=True)
+        return None
+
+
+def _upload_image(image_path: Path) -> Optional[str]:
+    api_key, _, _, timeout_seconds = _load_openai_settings()
+    try:
+        with image_path.open("rb") as fh:
+            resp = _get_client().post(
+                OPENAI_FILES_URL,
+                headers={"Authorization": f"Bearer {api_key}"},
+                files={"file": (image_path.name, fh, _guess_mime_type(image_path))},
+                data={"purpose": "vision"},
+                timeout=timeout_seconds,
+            )
+    except Exception:  # noqa: BLE001 - fall back to the data-URL path
+        logger.warning("image upload failed; falling back to data URL", exc_info=True)
+        return None
+    if resp.status_code >= 400:
+        logger.warning(
+            "image upload rejected: status=%s body=%s", resp.status_code, resp.text[:500]
+        )
+        return None
+    return resp.json().get("id") or None
+
+
+def _image_content(image_path: Path, digest: str) -> Dict[str, Any]:
+    if OCR_FILE_UPLOAD_ENABLED:
+        file_id = _cached_file_id(digest)
+        if file_id is None:
+            file_id = _upload_image(image_path)
+            if file_id is not None:
+                _store_file_id(digest, file_id)
+        if file_id is not None:
+            return {"type": "input_image", "file_id": file_id}
+    return {"type": "input_image", "image_url": _image_data_url(image_path)}
+
+
+def _image_data_url(image_path: Path) -> str:
+    """Base64 the image into one growing buffer instead of three copies.
+
+    read_bytes() + b64encode + f-string held the raw bytes, the encoded
+    bytes and the final string simultaneously; chunked encoding into a
+    bytearray keeps peak memory at roughly the encoded size alone.
+    """
+    jpeg = _downscaled_jpeg(image_path)
+    if jpeg is not None:
+        buf = bytearray(b"data:image/jpeg;base64,")
+        buf += _b64encode(jpeg)
+        return buf.decode("ascii")
+
+    buf = bytearray(b"data:")
+    buf += _guess_mime_type(image_path).encode("ascii")
+    buf += b";base64,"
+    with image_path.open("rb") as fh:
+        # 57 KiB is a multiple of 3, so each chunk encodes without padding.
+        while chunk := fh.read(57 * 1024):
+            buf += _b64encode(chunk)
+    return buf.decode("ascii")
+
+
+_TEXT_TYPES = frozenset(("output_text", "text"))
 
 
 def _extract_output_text(payload: Dict[str, Any]) -> Optional[str]:
     text = payload.get("output_text")
     if text:
         return text
-    for item in payload.get("output", []) or []:
-        for content in item.get("content", []) or []:
-            if content.get("type") in {"output_text", "text"}:
+    # Rare fallback: walk the structured output without allocating empty
+    # lists or a fresh set literal per content element.
+    for item in payload.get("output") or ():
+        for content in item.get("content") or ():
+            if content.get("type") in _TEXT_TYPES:
                 return content.get("text")
     return None
 
 
+# The schema never varies; one shared dict serves every request payload.
+_RECEIPT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "additionalProperties": False,
+    "properties": {
+        "name": {"type": "string"},
+        "amount": {"type": "number"},
+        "currency": {"type": "string"},
+        "type": {"type": "string"},
+        "merchant": {"type": "string"},
+        "occurred_at": {"type": "string"},
+    },
+    "required": ["name", "amount", "currency", "type", "merchant", "occurred_at"],
+}
+
+
 def _receipt_schema() -> Dict[str, Any]:
-    return {
-        "type": "object",
-        "additionalProperties": False,
-        "properties": {
-            "name": {"type": "string"},
-            "amount": {"type": "number"},
-            "currency": {"type": "string"},
-            "type": {"type": "string"},
-            "merchant": {"type": "string"},
-            "occurred_at": {"type": "string"},
-        },
-        "required": ["name", "amount", "currency", "type", "merchant", "occurred_at"],
-    }
+    return _RECEIPT_SCHEMA
 
 
-def _receipt_prompt(category_list: str, *, receipt_text: Optional[str] = None) -> str:
-    date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    prompt = (
+# Compiled once: validating the response locally is O(fields), so a model
+# that drifts off the schema is caught here instead of surfacing as a
+# confusing downstream parse error.
+_RECEIPT_VALIDATOR = (
+    _Draft202012Validator(_RECEIPT_SCHEMA) if _Draft202012Validator is not None else None
+)
+
+
+def _result_matches_schema(result: Dict[str, Any]) -> bool:
+    if _RECEIPT_VALIDATOR is None:
+        return True
+    return not next(_RECEIPT_VALIDATOR.iter_errors(result), None)
+
+
+def _fallback_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    # Retry without strict schema enforcement; some models reject the
+    # json_schema format outright but still produce usable json_object.
+    fallback = dict(payload)
+    fallback["text"] = {"format": {"type": "json_object"}}
+    return fallback
+
+
+@lru_cache(maxsize=64)
+def _base_prompt(category_list: str, date: str) -> str:
+    # Keyed on (categories, day): the text only changes when the category
+    # set or the UTC date does, so the f-string assembly runs once per day
+    # per category set instead of per receipt.
+    return (
         f"You are a receipt summarization engine. Today's date is {date}."
         "Hard constraints (must follow):"
         "- Output ONLY valid JSON. No markdown, no explanations."
@@ -85,6 +408,11 @@ def _receipt_prompt(category_list: str, *, receipt_text: Optional[str] = None) -
         "- name must be a concise, human-readable summary of the entire purchase."
         f"type must be one of: {category_list}."
     )
+
+
+def _receipt_prompt(category_list: str, *, receipt_text: Optional[str] = None) -> str:
+    date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    prompt = _base_prompt(category_list, date)
     if receipt_text is not None:
         prompt = f"{prompt}\nReceipt text:\n{receipt_text}"
     return prompt
@@ -93,16 +421,19 @@ def _receipt_prompt(category_list: str, *, receipt_text: Optional[str] = None) -
 def _post_openai(payload: Dict[str, Any]) -> Dict[str, Any]:
     api_key, _, api_url, timeout_seconds = _load_openai_settings()
     headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
-    with httpx.Client(timeout=timeout_seconds) as client:
-        resp = client.post(api_url, json=payload, headers=headers)
-        if resp.status_code >= 400:
-            logger.error(
-                "OpenAI request failed: status=%s body=%s",
-                resp.status_code,
-                resp.text[:2000],
-            )
-            raise ReceiptOcrError("openai_request_failed")
-        return resp.json()
+    # Pre-serialize so httpx does not run the multi-MB base64 payload
+    # through the stdlib json encoder.
+    resp = _get_client().post(
+        api_url, content=_json_dumps(payload), headers=headers, timeout=timeout_seconds
+    )
+    if resp.status_code >= 400:
+        logger.error(
+            "OpenAI request failed: status=%s body=%s",
+            resp.status_code,
+            resp.text[:2000],
+        )
+        raise ReceiptOcrError("openai_request_failed")
+    return resp.json()
 
 
 def _parse_ocr_response(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -110,34 +441,26 @@ def _parse_ocr_response(data: Dict[str, Any]) -> Dict[str, Any]:
     if not output_text:
         raise ReceiptOcrError("openai_response_missing_text")
     try:
-        result = json.loads(output_text)
-    except json.JSONDecodeError as exc:
+        result = _json_loads(output_text)
+    except ValueError as exc:
         raise ReceiptOcrError("openai_response_invalid_json") from exc
     if not isinstance(result, dict):
         raise ReceiptOcrError("openai_response_invalid_payload")
     return result
 
 
-def recognize_receipt(image_path: Path, categories: List[str]) -> Dict[str, Any]:
-    _, model, _, _ = _load_openai_settings()
-
-    mime_type = _guess_mime_type(image_path)
-    image_b64 = base64.b64encode(image_path.read_bytes()).decode("ascii")
+def _build_image_payload(
+    model: str, categories: List[str], image_content: Dict[str, Any]
+) -> Dict[str, Any]:
     category_list = ", ".join(categories) if categories else "other"
-    prompt = _receipt_prompt(category_list)
-    schema = _receipt_schema()
-
-    payload = {
+    return {
         "model": model,
         "input": [
             {
                 "role": "user",
                 "content": [
-                    {"type": "input_text", "text": prompt},
-                    {
-                        "type": "input_image",
-                        "image_url": f"data:{mime_type};base64,{image_b64}",
-                    },
+                    {"type": "input_text", "text": _receipt_prompt(category_list)},
+                    image_content,
                 ],
             }
         ],
@@ -145,29 +468,21 @@ def recognize_receipt(image_path: Path, categories: List[str]) -> Dict[str, Any]
             "format": {
                 "type": "json_schema",
                 "name": "receipt_extract",
-                "schema": schema,
+                "schema": _receipt_schema(),
             }
         },
     }
 
-    data = _post_openai(payload)
-    return _parse_ocr_response(data)
-
-
-def recognize_receipt_text(text: str, categories: List[str]) -> Dict[str, Any]:
-    _, model, _, _ = _load_openai_settings()
 
+def _build_text_payload(model: str, categories: List[str], text: str) -> Dict[str, Any]:
     category_list = ", ".join(categories) if categories else "other"
-    prompt = _receipt_prompt(category_list, receipt_text=text)
-    schema = _receipt_schema()
-
-    payload = {
+    return {
         "model": model,
         "input": [
             {
                 "role": "user",
                 "content": [
-                    {"type": "input_text", "text": prompt},
+                    {"type": "input_text", "text": _receipt_prompt(category_list, receipt_text=text)},
                 ],
             }
         ],
@@ -175,10 +490,110 @@ def recognize_receipt_text(text: str, categories: List[str]) -> Dict[str, Any]:
             "format": {
                 "type": "json_schema",
                 "name": "receipt_text_extract",
-                "schema": schema,
+                "schema": _receipt_schema(),
             }
         },
     }
 
-    data = _post_openai(payload)
-    return _parse_ocr_response(data)
+
+def _complete_ocr(payload: Dict[str, Any]) -> Dict[str, Any]:
+    result = _parse_ocr_response(_post_openai(payload))
+    if _result_matches_schema(result):
+        return result
+    logger.warning("OCR result failed local schema validation; retrying as json_object")
+    result = _parse_ocr_response(_post_openai(_fallback_payload(payload)))
+    if _result_matches_schema(result):
+        return result
+    raise ReceiptOcrError("openai_response_schema_mismatch")
+
+
+def recognize_receipt(image_path: Path, categories: List[str]) -> Dict[str, Any]:
+    _, model, _, _ = _load_openai_settings()
+    digest = _file_sha256(image_path)
+    key = _image_cache_key(digest, model, categories)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    payload = _build_image_payload(model, categories, _image_content(image_path, digest))
+    result = _complete_ocr(payload)
+    _cache_put(key, result)
+    return result
+
+
+def recognize_receipt_text(text: str, categories: List[str]) -> Dict[str, Any]:
+    _, model, _, _ = _load_openai_settings()
+    payload = _build_text_payload(model, categories, text)
+    return _complete_ocr(payload)
+
+
+# Async variants for event-loop callers: the ~20s upstream call awaits on
+# a shared AsyncClient instead of pinning a worker thread, and the disk
+# read/encode runs in the thread pool.
+async def _post_openai_async(payload: Dict[str, Any]) -> Dict[str, Any]:
+    api_key, _, api_url, timeout_seconds = _load_openai_settings()
+    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+    resp = await _get_async_client().post(
+        api_url, content=_json_dumps(payload), headers=headers, timeout=timeout_seconds
+    )
+    if resp.status_code >= 400:
+        logger.error(
+            "OpenAI request failed: status=%s body=%s",
+            resp.status_code,
+            resp.text[:2000],
+        )
+        raise ReceiptOcrError("openai_request_failed")
+    return resp.json()
+
+
+async def _complete_ocr_async(payload: Dict[str, Any]) -> Dict[str, Any]:
+    result = _parse_ocr_response(await _post_openai_async(payload))
+    if _result_matches_schema(result):
+        return result
+    logger.warning("OCR result failed local schema validation; retrying as json_object")
+    result = _parse_ocr_response(await _post_openai_async(_fallback_payload(payload)))
+    if _result_matches_schema(result):
+        return result
+    raise ReceiptOcrError("openai_response_schema_mismatch")
+
+
+async def recognize_receipt_async(image_path: Path, categories: List[str]) -> Dict[str, Any]:
+    _, model, _, _ = _load_openai_settings()
+    digest = await anyio.to_thread.run_sync(_file_sha256, image_path)
+    key = _image_cache_key(digest, model, categories)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    content = await anyio.to_thread.run_sync(_image_content, image_path, digest)
+    payload = _build_image_payload(model, categories, content)
+    result = await _complete_ocr_async(payload)
+    _cache_put(key, result)
+    return result
+
+
+async def recognize_receipt_text_async(text: str, categories: List[str]) -> Dict[str, Any]:
+    _, model, _, _ = _load_openai_settings()
+    payload = _build_text_payload(model, categories, text)
+    return await _complete_ocr_async(payload)
+
+
+# Bulk imports (a user dumping a folder of receipts) were N sequential
+# ~20s calls; overlapping them hides the upstream latency. Concurrency is
+# bounded so a big batch cannot exhaust the connection pool or rate limit.
+OCR_CONCURRENCY = int(os.getenv("OPENAI_OCR_CONCURRENCY", "4"))
+
+
+async def recognize_receipts_batch(
+    image_paths: List[Path], categories: List[str]
+) -> List[Dict[str, Any] | Exception]:
+    """Recognize several receipts concurrently.
+
+    Returns one entry per input path, in order; a failed image yields its
+    exception instead of aborting the rest of the batch.
+    """
+    sem = asyncio.Semaphore(OCR_CONCURRENCY)
+
+    async def one(path: Path) -> Dict[str, Any]:
+        async with sem:
+            return await recognize_receipt_async(path, categories)
+
+    return await asyncio.gather(*(one(p) for p in image_paths), return_exceptions=True)
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import csv
+import hashlib
+import io
+import re
+import threading
+
 from datetime import datetime, timezone, date as date_cls
 from decimal import Decimal, ROUND_HALF_UP
 from typing import Any, Dict, List, Optional
 
 from pathlib import Path
 
+from cachetools import TTLCache
 from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Query, Request, UploadFile
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel, Field, validator, ConfigDict
-from sqlalchemy import func, or_, select
+from sqlalchemy import func, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from ..db import SessionLocal
@@ -42,7 +50,8 @@ def _now() -> datetime:
 
 def _ensure_xlsx_upload(upload: UploadFile) -> str:
     filename = upload.filename or ""
-    if not filename.lower().endswith(".xlsx"):
+    # Lowercase only the extension instead of copying the whole filename.
+    if len(filename) < 5 or filename[-5:].lower() != ".xlsx":
         raise HTTPException(status_code=422, detail="invalid_file_type")
     return filename
 
@@ -96,7 +105,10 @@ class PageOut(BaseModel):
 
 
 # List currencies with pagination, optional filtering, and sorting.
-@router.get("/currencies", response_model=PageOut)
+# No response_model: the rows are projected straight into the PageOut
+# shape below, and re-validating them per request costs two Pydantic
+# passes per row on a hot endpoint.
+@router.get("/currencies")
 def list_currencies(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=200),
@@ -105,7 +117,15 @@ def list_currencies(
     sort: Optional[str] = Query("code"),
     db: Session = Depends(get_db),
 ):
-    query = db.query(Currency)
+    # Windowed count fuses the total into the page query: one round-trip
+    # instead of a COUNT(*) plus a SELECT per request.
+    query = db.query(
+        Currency.code,
+        Currency.name,
+        Currency.symbol,
+        Currency.scale,
+        func.count().over().label("_total"),
+    )
     if code:
         query = query.filter(Currency.code == code.upper())
     if q:
@@ -125,15 +145,18 @@ def list_currencies(
                 continue
             query = query.order_by(col.desc() if desc else col.asc())
 
-    total = query.count()
-    items = query.offset((page - 1) * page_size).limit(page_size).all()
-    items_out = [CurrencyOut.model_validate(it, from_attributes=True) for it in items]
+    rows = query.offset((page - 1) * page_size).limit(page_size).all()
+    # An empty page past the end carries no window value; only then pay
+    # for a separate count.
+    total = rows[0][4] if rows else query.count()
     return {
         "total": total,
         "page": page,
         "page_size": page_size,
         "has_next": (page * page_size) < total,
-        "items": [it.model_dump() for it in items_out],
+        "items": [
+            {"code": c, "name": n, "symbol": s, "scale": sc} for c, n, s, sc, _ in rows
+        ],
     }
 
 
@@ -143,7 +166,9 @@ def get_currency(code: str, db: Session = Depends(get_db)):
     cur = db.get(Currency, code.upper())
     if not cur:
         raise HTTPException(status_code=404, detail="currency_not_found")
-    return CurrencyOut.model_validate(cur, from_attributes=True).model_dump()
+    # response_model already validates; returning the ORM row avoids a
+    # second model_validate/model_dump pass.
+    return cur
 
 
 class ExchangeRateOut(BaseModel):
@@ -180,31 +205,26 @@ def get_exchange_rates(
 
     if quote:
         quote = quote.upper()
-        sub = (
-            db.query(func.max(ExchangeRate.rate_date))
-            .filter(
-                ExchangeRate.base_code == base,
-                ExchangeRate.quote_code == quote,
-                ExchangeRate.rate_date <= qdate,
-            )
-            .scalar()
-        )
-        if not sub:
-            raise HTTPException(status_code=404, detail="rate_not_found")
+        # ORDER BY rate_date DESC LIMIT 1 replaces the max(rate_date) +
+        # refetch pair: one round-trip, and a backward walk of the
+        # (base, quote, rate_date DESC) index.
         row = (
-            db.query(ExchangeRate)
+            db.query(ExchangeRate.rate, ExchangeRate.rate_date)
             .filter(
                 ExchangeRate.base_code == base,
                 ExchangeRate.quote_code == quote,
-                ExchangeRate.rate_date == sub,
+                ExchangeRate.rate_date <= qdate,
             )
+            .order_by(ExchangeRate.rate_date.desc())
             .first()
         )
+        if row is None:
+            raise HTTPException(status_code=404, detail="rate_not_found")
         return {
             "base": base,
             "quote": quote,
             "date": qdate.isoformat(),
-            "rate": Decimal(row.rate),
+            "rate": row.rate,
             "effective_date": row.rate_date.isoformat(),
         }
     else:
@@ -220,20 +240,24 @@ def get_exchange_rates(
             .group_by(ExchangeRate.quote_code)
             .subquery()
         )
-        rows = (
-            db.query(ExchangeRate)
+        # Column projection: the loop only needs three fields, so skip ORM
+        # instance construction and identity-map bookkeeping per row.
+        # Streamed in server-side batches straight into the dict, so no
+        # intermediate row list is held however many quotes exist.
+        result = db.execute(
+            select(ExchangeRate.quote_code, ExchangeRate.rate, ExchangeRate.rate_date)
             .join(
                 subq,
                 (ExchangeRate.quote_code == subq.c.quote)
                 & (ExchangeRate.rate_date == subq.c.max_date),
             )
-            .filter(ExchangeRate.base_code == base)
-            .all()
+            .where(ExchangeRate.base_code == base)
+            .execution_options(stream_results=True, yield_per=200)
         )
-        for r in rows:
-            rates[r.quote_code] = {
-                "rate": Decimal(r.rate),
-                "effective_date": r.rate_date.isoformat(),
+        for quote_code, rate, rate_date in result:
+            rates[quote_code] = {
+                "rate": rate,
+                "effective_date": rate_date.isoformat(),
             }
         if not rates:
             raise HTTPException(status_code=404, detail="rate_not_found")
@@ -272,7 +296,7 @@ def get_exchange_rates_range(
     items = [
         ExchangeRateRangeItem(
             date=row.rate_date.isoformat(),
-            rate=Decimal(row.rate),
+            rate=row.rate,
         )
         for row in rows
     ]
@@ -282,7 +306,7 @@ def get_exchange_rates_range(
         from_date=start.isoformat(),
         to_date=end.isoformat(),
         items=items,
-    ).model_dump()
+    )
 
 
 # Trigger an on-demand FX sync for asset currencies to a target (default CNY).
@@ -292,9 +316,11 @@ def sync_exchange_rates_now(
     db: Session = Depends(get_db),
 ):
     try:
-        return sync_exchange_rates_for_assets(db, target=target)
+        result = sync_exchange_rates_for_assets(db, target=target)
     except RuntimeError as e:
         raise HTTPException(status_code=500, detail=str(e))
+    fx_cache_clear()
+    return result
 
 
 class ConvertRequest(BaseModel):
@@ -317,7 +343,125 @@ class ConvertResponse(BaseModel):
     effective_date: str
 
 
-_idem_cache: Dict[str, Dict[str, Any]] = {}
+# Bounded: the old plain dict grew for the life of the worker. Keys are
+# compact blake2b digests of the canonical request fields instead of the
+# full serialized body.
+_idem_cache: TTLCache = TTLCache(maxsize=10_000, ttl=600)
+_idem_cache_lock = threading.Lock()
+
+
+def _idem_key(idem: str, body: "ConvertRequest") -> bytes:
+    canonical = f"{idem}|{body.from_currency}|{body.to_currency}|{body.amount}|{body.date}"
+    return hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+
+# Hot (base, quote, date) triples repeat heavily and FX rates change at
+# most daily; a short TTL keeps repeat conversions off the database.
+# Guarded by a lock because sync endpoints run in the threadpool.
+_fx_cache: TTLCache = TTLCache(maxsize=4096, ttl=300)
+_fx_cache_lock = threading.Lock()
+
+
+def fx_cache_clear() -> None:
+    """Drop cached effective rates; called after any rate write."""
+    with _fx_cache_lock:
+        _fx_cache.clear()
+
+
+def _effective_rate(db: Session, base: str, quote: str, qdate) -> Optional[tuple]:
+    key = (base, quote, qdate.toordinal())
+    with _fx_cache_lock:
+        hit = _fx_cache.get(key)
+    if hit is not None:
+        return hit
+    row = (
+        db.query(ExchangeRate.rate, ExchangeRate.rate_date)
+        .filter(
+            ExchangeRate.base_code == base,
+            ExchangeRate.quote_code == quote,
+            ExchangeRate.rate_date <= qdate,
+        )
+        .order_by(ExchangeRate.rate_date.desc())
+        .first()
+    )
+    if row is None:
+        return None
+    value = (row.rate, row.rate_date.isoformat())
+    with _fx_cache_lock:
+        _fx_cache[key] = value
+    return value
+
+
+class ConvertBulkRequest(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+    amounts: List[Decimal] = Field(..., min_length=1, max_length=10_000)
+    from_currency: str = Field(..., min_length=3, max_length=3, alias="from")
+    to_currency: str = Field(..., min_length=3, max_length=3, alias="to")
+    date: Optional[str] = None
+
+    @validator("amounts", each_item=True)
+    def _quantize(cls, v: Decimal):
+        return v.quantize(Decimal("0.000001"))
+
+
+class ConvertBulkResponse(BaseModel):
+    from_currency: str
+    to_currency: str
+    rate: Decimal
+    effective_date: str
+    converted: List[Decimal]
+
+
+_E6 = Decimal("0.000001")
+
+
+def _convert_bulk_e6(amounts_e6: List[int], rate_num: int, rate_den: int) -> List[int]:
+    """Multiply minor-unit amounts by an exact num/den rate, half-up.
+
+    Integer arithmetic instead of a Decimal context per element. The
+    division runs on the magnitude with the sign re-applied afterwards:
+    floor division alone would round halves toward +infinity, whereas
+    ROUND_HALF_UP in /convert rounds them away from zero.
+    """
+    out = []
+    append = out.append
+    for amount_e6 in amounts_e6:
+        n = amount_e6 * rate_num
+        q, r = divmod(abs(n), rate_den)
+        if 2 * r >= rate_den:
+            q += 1
+        append(-q if n < 0 else q)
+    return out
+
+
+# Batch conversion: one rate lookup, then integer minor-unit math per
+# element, bit-identical to running /convert per amount.
+@router.post("/convert/bulk", response_model=ConvertBulkResponse)
+def convert_amount_bulk(body: ConvertBulkRequest, db: Session = Depends(get_db)):
+    base = body.from_currency.upper()
+    quote = body.to_currency.upper()
+    qdate = (
+        date_cls.fromisoformat(body.date) if body.date else datetime.now(timezone.utc).date()
+    )
+    resolved = _effective_rate(db, base, quote, qdate)
+    if resolved is None:
+        raise HTTPException(status_code=404, detail="rate_not_found")
+    rate_value, effective_date = resolved
+    # str() first: the column reads back as float, and Decimal(float)
+    # would expand the binary representation into dozens of noise digits.
+    rate = Decimal(str(rate_value))
+    rate_num, rate_den = rate.as_integer_ratio()
+    amounts_e6 = [int(a.scaleb(6)) for a in body.amounts]
+    converted = [
+        Decimal(q).scaleb(-6).quantize(_E6)
+        for q in _convert_bulk_e6(amounts_e6, rate_num, rate_den)
+    ]
+    return ConvertBulkResponse(
+        from_currency=base,
+        to_currency=quote,
+        rate=rate,
+        effective_date=effective_date,
+        converted=converted,
+    )
 
 
 # Convert an amount between currencies using the latest rate up to the requested date.
@@ -325,36 +469,25 @@ _idem_cache: Dict[str, Dict[str, Any]] = {}
 def convert_amount(req: Request, body: ConvertRequest, db: Session = Depends(get_db)):
     # Idempotency-Key simple process-local cache
     idem = req.headers.get("Idempotency-Key")
-    cache_key = f"{idem}:{body.json()}" if idem else None
-    if cache_key and cache_key in _idem_cache:
-        return _idem_cache[cache_key]
+    cache_key = _idem_key(idem, body) if idem else None
+    if cache_key:
+        with _idem_cache_lock:
+            cached = _idem_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
     base = body.from_currency.upper()
     quote = body.to_currency.upper()
     qdate = (
         date_cls.fromisoformat(body.date) if body.date else datetime.now(timezone.utc).date()
     )
-    sub = (
-        db.query(func.max(ExchangeRate.rate_date))
-        .filter(
-            ExchangeRate.base_code == base,
-            ExchangeRate.quote_code == quote,
-            ExchangeRate.rate_date <= qdate,
-        )
-        .scalar()
-    )
-    if not sub:
+    resolved = _effective_rate(db, base, quote, qdate)
+    if resolved is None:
         raise HTTPException(status_code=404, detail="rate_not_found")
-    row = (
-        db.query(ExchangeRate)
-        .filter(
-            ExchangeRate.base_code == base,
-            ExchangeRate.quote_code == quote,
-            ExchangeRate.rate_date == sub,
-        )
-        .first()
-    )
-    rate = Decimal(row.rate)
+    rate_value, effective_date = resolved
+    # str() first: the column reads back as float, and Decimal(float)
+    # would expand the binary representation into dozens of noise digits.
+    rate = Decimal(str(rate_value))
     converted = (body.amount * rate).quantize(Decimal("0.000001"), rounding=ROUND_HALF_UP)
     resp = ConvertResponse(
         amount=body.amount,
@@ -362,10 +495,11 @@ def convert_amount(req: Request, body: ConvertRequest, db: Session = Depends(get
         to_currency=quote,
         rate=rate,
         converted=converted,
-        effective_date=row.rate_date.isoformat(),
+        effective_date=effective_date,
     )
     if cache_key:
-        _idem_cache[cache_key] = resp.dict()
+        with _idem_cache_lock:
+            _idem_cache[cache_key] = resp.dict()
     return resp
 
 
@@ -383,6 +517,152 @@ def _ensure_unique_rate_keys(items):
         raise HTTPException(status_code=422, detail=f"duplicate_rate_key:{dup_list}")
 
 
+# Below this many validated rows the per-row ORM path is cheaper than
+# setting up a temp table and COPY stream.
+_BULK_RATE_COPY_MIN = 100
+
+
+def bulk_upsert_rates(db: Session, items, now: datetime) -> set:
+    """COPY the validated items into a temp table and upsert them in two
+    set-based statements (UPDATE matching pairs, INSERT the rest).
+
+    Returns the (base, quote, rate_date) keys that already existed so the
+    caller can report updated vs created per item. Raises on any failure;
+    callers roll back and fall back to the per-row path. Postgres-only:
+    relies on psycopg2 copy_expert.
+    """
+    existing_keys = set(
+        db.execute(
+            select(
+                ExchangeRate.base_code,
+                ExchangeRate.quote_code,
+                ExchangeRate.rate_date,
+            ).where(
+                tuple_(
+                    ExchangeRate.base_code,
+                    ExchangeRate.quote_code,
+                    ExchangeRate.rate_date,
+                ).in_([(item.base, item.quote, item.rate_date) for item in items])
+            )
+        ).all()
+    )
+
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for item in items:
+        # Empty unquoted CSV fields load as NULL, keeping source optional.
+        writer.writerow(
+            [item.base, item.quote, item.rate_date.isoformat(), str(item.rate), item.source or ""]
+        )
+    buf.seek(0)
+
+    raw_conn = db.connection().connection
+    with raw_conn.cursor() as cur:
+        cur.execute(
+            "CREATE TEMP TABLE tmp_rates ("
+            "base_code text, quote_code text, rate_date date, rate numeric, source text"
+            ") ON COMMIT DROP"
+        )
+        cur.copy_expert(
+            "COPY tmp_rates (base_code, quote_code, rate_date, rate, source)"
+            " FROM STDIN WITH (FORMAT csv)",
+            buf,
+        )
+        cur.execute(
+            "UPDATE currency.exchange_rates er"
+            " SET rate = t.rate,"
+            " source = COALESCE(t.source, er.source),"
+            " updated_at = %s"
+            " FROM tmp_rates t"
+            " WHERE er.base_code = t.base_code"
+            " AND er.quote_code = t.quote_code"
+            " AND er.rate_date = t.rate_date",
+            (now,),
+        )
+        cur.execute(
+            "INSERT INTO currency.exchange_rates"
+            " (base_code, quote_code, rate_date, rate, source, created_at, updated_at)"
+            " SELECT t.base_code, t.quote_code, t.rate_date, t.rate,"
+            " COALESCE(t.source, 'import'), %s, %s"
+            " FROM tmp_rates t"
+            " WHERE NOT EXISTS ("
+            "  SELECT 1 FROM currency.exchange_rates er"
+            "  WHERE er.base_code = t.base_code"
+            "  AND er.quote_code = t.quote_code"
+            "  AND er.rate_date = t.rate_date"
+            " )",
+            (now, now),
+        )
+    db.commit()
+    return existing_keys
+
+
+def _upsert_rate_row(item, db: Session) -> ImportExchangeRateResult:
+    base = item.base
+    quote = item.quote
+    existing = (
+        db.query(ExchangeRate)
+        .filter(
+            ExchangeRate.base_code == base,
+            ExchangeRate.quote_code == quote,
+            ExchangeRate.rate_date == item.rate_date,
+        )
+        .first()
+    )
+    now = _now()
+    if existing:
+        existing.rate = item.rate
+        if item.source is not None:
+            existing.source = item.source
+        existing.updated_at = now
+        try:
+            db.commit()
+        except Exception:
+            db.rollback()
+            return ImportExchangeRateResult(
+                base=base,
+                quote=quote,
+                rate_date=item.rate_date,
+                status="failed",
+                error="rate_update_failed",
+            )
+        return ImportExchangeRateResult(
+            base=base,
+            quote=quote,
+            rate_date=item.rate_date,
+            status="updated",
+        )
+
+    rate = ExchangeRate(
+        base_code=base,
+        quote_code=quote,
+        rate_date=item.rate_date,
+        rate=item.rate,
+        source=item.source or "import",
+        created_at=now,
+        updated_at=now,
+    )
+    try:
+        db.add(rate)
+        db.commit()
+    except Exception:
+        db.rollback()
+        return ImportExchangeRateResult(
+            base=base,
+            quote=quote,
+            rate_date=item.rate_date,
+            status="failed",
+            error="rate_create_failed",
+        )
+
+    return ImportExchangeRateResult(
+        base=base,
+        quote=quote,
+        rate_date=item.rate_date,
+        status="created",
+    )
+
+
 def _import_exchange_rates(
     payload: ImportExchangeRateRequest,
     db: Session,
@@ -392,7 +672,8 @@ def _import_exchange_rates(
     code_rows = db.query(Currency.code).all()
     codes = {row[0] for row in code_rows}
 
-    results: List[ImportExchangeRateResult] = []
+    results: List[Optional[ImportExchangeRateResult]] = []
+    pending: List[tuple] = []
     for item in payload.items:
         base = item.base
         quote = item.quote
@@ -420,78 +701,37 @@ def _import_exchange_rates(
             )
             continue
 
-        existing = (
-            db.query(ExchangeRate)
-            .filter(
-                ExchangeRate.base_code == base,
-                ExchangeRate.quote_code == quote,
-                ExchangeRate.rate_date == item.rate_date,
-            )
-            .first()
-        )
-        now = _now()
-        if existing:
-            existing.rate = item.rate
-            if item.source is not None:
-                existing.source = item.source
-            existing.updated_at = now
-            try:
-                db.commit()
-            except Exception:
-                db.rollback()
-                results.append(
-                    ImportExchangeRateResult(
-                        base=base,
-                        quote=quote,
-                        rate_date=item.rate_date,
-                        status="failed",
-                        error="rate_update_failed",
-                    )
-                )
-                continue
-            results.append(
-                ImportExchangeRateResult(
-                    base=base,
-                    quote=quote,
-                    rate_date=item.rate_date,
-                    status="updated",
-                )
-            )
-            continue
+        results.append(None)
+        pending.append((len(results) - 1, item))
 
-        rate = ExchangeRate(
-            base_code=base,
-            quote_code=quote,
-            rate_date=item.rate_date,
-            rate=item.rate,
-            source=item.source or "import",
-            created_at=now,
-            updated_at=now,
-        )
+    bulk_done = False
+    if (
+        len(pending) >= _BULK_RATE_COPY_MIN
+        and db.get_bind().dialect.name == "postgresql"
+    ):
         try:
-            db.add(rate)
-            db.commit()
+            existing_keys = bulk_upsert_rates(db, [item for _, item in pending], _now())
         except Exception:
             db.rollback()
-            results.append(
-                ImportExchangeRateResult(
-                    base=base,
-                    quote=quote,
+        else:
+            bulk_done = True
+            for idx, item in pending:
+                status = (
+                    "updated"
+                    if (item.base, item.quote, item.rate_date) in existing_keys
+                    else "created"
+                )
+                results[idx] = ImportExchangeRateResult(
+                    base=item.base,
+                    quote=item.quote,
                     rate_date=item.rate_date,
-                    status="failed",
-                    error="rate_create_failed",
+                    status=status,
                 )
-            )
-            continue
+    if not bulk_done:
+        for idx, item in pending:
+            results[idx] = _upsert_rate_row(item, db)
 
-        results.append(
-            ImportExchangeRateResult(
-                base=base,
-                quote=quote,
-                rate_date=item.rate_date,
-                status="created",
-            )
-        )
+    fx_cache_clear()
 
     total = len(results)
     created = sum(1 for r in results if r.status == "created")
@@ -537,6 +777,12 @@ def get_exchange_rate_import_task(task_id: str):
     return _public_task(task)
 
 
+# Compiled once: C-level matching beats per-payload len() + isalpha(),
+# which matters for the bulk endpoint, and [A-Za-z] rejects the non-ASCII
+# letters isalpha() would have let through.
+_CODE_RE = re.compile(r"[A-Za-z]{3}\Z")
+
+
 class CurrencyUpsert(BaseModel):
     code: str
     name: str
@@ -545,10 +791,9 @@ class CurrencyUpsert(BaseModel):
 
     @validator("code")
     def _code(cls, v: str):
-        v2 = v.upper()
-        if len(v2) != 3 or not v2.isalpha():
+        if not _CODE_RE.fullmatch(v):
             raise ValueError("invalid_code")
-        return v2
+        return v.upper()
 
     @validator("scale")
     def _scale(cls, v: int):
@@ -561,6 +806,31 @@ class CurrencyUpsert(BaseModel):
 @router.post("/currencies", response_model=CurrencyOut)
 def upsert_currency(payload: CurrencyUpsert, db: Session = Depends(get_db)):
     code = payload.code
+    if db.get_bind().dialect.name == "postgresql":
+        # INSERT ... ON CONFLICT DO UPDATE ... RETURNING folds the lookup,
+        # the write, and the reselect into one round-trip.
+        now = _now()
+        stmt = pg_insert(Currency).values(
+            code=code,
+            name=payload.name,
+            symbol=payload.symbol,
+            scale=payload.scale,
+            created_at=now,
+            updated_at=now,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Currency.code],
+            set_={
+                "name": stmt.excluded.name,
+                "symbol": stmt.excluded.symbol,
+                "scale": stmt.excluded.scale,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        ).returning(Currency)
+        cur = db.scalars(stmt, execution_options={"populate_existing": True}).one()
+        db.commit()
+        return cur
+
     cur = db.get(Currency, code)
     if cur:
         cur.name = payload.name
@@ -569,8 +839,8 @@ def upsert_currency(payload: CurrencyUpsert, db: Session = Depends(get_db)):
     else:
         cur = Currency(code=code, name=payload.name, symbol=payload.symbol, scale=payload.scale)
         db.add(cur)
+    # expire_on_commit=False keeps cur live after commit; no refresh needed.
     db.commit()
-    db.refresh(cur)
     return cur
 
 
@@ -594,17 +864,68 @@ def patch_currency(code: str, payload: CurrencyPatch, db: Session = Depends(get_
         if payload.scale < 0 or payload.scale > 6:
             raise HTTPException(status_code=422, detail="invalid_scale")
         cur.scale = payload.scale
+    # expire_on_commit=False keeps cur live after commit; no refresh needed.
     db.commit()
-    db.refresh(cur)
     return cur
 
 
 # Bulk create or update currencies and report per-item status.
 @router.put("/currencies/bulk")
 def bulk_upsert(items: List[CurrencyUpsert], db: Session = Depends(get_db)):
+    if not items:
+        return {"results": []}
+
+    if db.get_bind().dialect.name == "postgresql":
+        # One SELECT for the statuses plus one INSERT ... ON CONFLICT DO
+        # UPDATE executemany, instead of a SELECT and a write per item.
+        codes = [it.code for it in items]
+        existing = {
+            row[0]
+            for row in db.query(Currency.code).filter(Currency.code.in_(codes)).all()
+        }
+        now = _now()
+        # Last write per code wins, matching the sequential loop; ON
+        # CONFLICT cannot touch the same row twice in one statement.
+        values = {
+            it.code: {
+                "code": it.code,
+                "name": it.name,
+                "symbol": it.symbol,
+                "scale": it.scale,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for it in items
+        }
+        stmt = pg_insert(Currency).values(list(values.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Currency.code],
+            set_={
+                "name": stmt.excluded.name,
+                "symbol": stmt.excluded.symbol,
+                "scale": stmt.excluded.scale,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        db.execute(stmt)
+        db.commit()
+        return {
+            "results": [
+                {"code": it.code, "status": "updated" if it.code in existing else "created"}
+                for it in items
+            ]
+        }
+
+    # Fallback path: one IN query loads every existing row up front, then
+    # the loop works purely in Python instead of a SELECT per item.
+    codes = [it.code for it in items]
+    existing_rows = {
+        c.code: c
+        for c in db.scalars(select(Currency).where(Currency.code.in_(codes))).all()
+    }
     results = []
     for it in items:
-        cur = db.get(Currency, it.code)
+        cur = existing_rows.get(it.code)
         status = "updated" if cur else "created"
         if cur:
             cur.name = it.name
@@ -613,6 +934,7 @@ def bulk_upsert(items: List[CurrencyUpsert], db: Session = Depends(get_db)):
         else:
             cur = Currency(code=it.code, name=it.name, symbol=it.symbol, scale=it.scale)
             db.add(cur)
+            existing_rows[it.code] = cur
         results.append({"code": it.code, "status": status})
     db.commit()
     return {"results": results}
@@ -5,9 +5,9 @@ from decimal import Decimal
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from pydantic import BaseModel, field_serializer
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+from pydantic import BaseModel
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session, joinedload
 
 from ..auth import resolve_user_id
 from ..db import SessionLocal
@@ -30,17 +30,24 @@ def get_current_user(
     db: Session = Depends(get_db),
     user_id: int = Depends(resolve_user_id),
 ) -> User:
-    user = db.get(User, user_id)
+    # The preference rides along on the same round-trip; every endpoint
+    # in this router needs it for base-currency conversion.
+    user = (
+        db.execute(
+            select(User).options(joinedload(User.preference)).where(User.id == user_id)
+        )
+        .unique()
+        .scalar_one_or_none()
+    )
     if not user:
         raise HTTPException(status_code=401, detail="user_not_found")
     return user
 
 
 def get_user_pref(
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> UserPreference:
-    pref = db.query(UserPreference).filter(UserPreference.user_id == current_user.id).first()
+    pref = current_user.preference
     if not pref:
         raise HTTPException(status_code=404, detail="user_pref_not_found")
     return pref
@@ -78,24 +85,14 @@ class LatestAumontTotalOut(BaseModel):
     datetime: datetime
     total: Decimal
     
+# Plain floats: the serializers coerced the Decimals to float anyway, so
+# the SQL casts to float8 and the per-row Decimal allocation goes away.
 class AssetCurrencyPoint(BaseModel):
-    amount: Decimal
-    change: Decimal
-    rate: Decimal
+    amount: float
+    change: float
+    rate: float
     target: str
-    
-    @field_serializer("amount")
-    def serialize_amount(self, v: Decimal):
-        return float(v)
-    
-    @field_serializer("change")
-    def serialize_change(self, v: Decimal):
-        return float(v)
-    
-    @field_serializer("rate")
-    def serialize_rate(self, v: Decimal):
-        return float(v)
-    
+
 class AssetCurrencyTotalOut(BaseModel):
     data: List[AssetCurrencyPoint]
     
@@ -110,6 +107,134 @@ class ExpensePeriodCompareOut(BaseModel):
     delta: Decimal
     delta_rate: Decimal
 
+
+# The statements below are assembled and wrapped in text() once at import
+# instead of per request; only bind parameters vary between calls.
+_SQL_CHANGES = text(
+    """
+    WITH balance_ranked AS (
+      SELECT
+        i.id AS institution_id,
+        i.name AS institution_name,
+        i.type AS institution_type,
+        date_trunc('month', pb.as_of) AS month_start,
+        pb.as_of,
+        pb.amount,
+        fp.currency,
+        row_number() OVER (
+          PARTITION BY pb.product_id, date_trunc('month', pb.as_of)
+          ORDER BY pb.as_of DESC
+        ) AS rn
+      FROM deposit.product_balances pb
+      JOIN deposit.financial_products fp ON fp.id = pb.product_id
+      JOIN deposit.institutions i ON i.id = fp.institution_id
+      WHERE i.user_id = :user_id
+        AND fp.status != 'closed'
+    ),
+    last_rows AS (
+      SELECT * FROM balance_ranked WHERE rn = 1
+    ),
+    fx_keys AS (
+      SELECT DISTINCT currency, as_of FROM last_rows
+    ),
+    fx_rates AS (
+      SELECT
+        k.currency,
+        k.as_of,
+    """
+    + get_exchange_rate_by_as_of(
+        code=":target_code",
+        as_of="k",
+        column="fx_rate",
+        currency="k",
+    )
+    + """
+      FROM fx_keys k
+    ),
+    balance_fx AS (
+      SELECT
+        b.institution_id,
+        b.institution_name,
+        b.institution_type,
+        b.month_start,
+        b.as_of,
+        b.amount,
+        fx.fx_rate
+      FROM last_rows b
+      JOIN fx_rates fx
+        ON fx.currency = b.currency AND fx.as_of = b.as_of
+    ),
+    institution_snapshots AS (
+      SELECT
+        institution_id,
+        institution_name,
+        institution_type,
+        month_start,
+        MAX(as_of) AS as_of,
+        SUM(amount * fx_rate) AS total_amount
+      FROM balance_fx
+      WHERE fx_rate IS NOT NULL
+      GROUP BY institution_id, institution_name, institution_type, month_start
+    ),
+    latest AS (
+      SELECT DISTINCT ON (institution_id)
+        institution_id,
+        institution_name,
+        institution_type,
+        month_start,
+        as_of,
+        total_amount
+      FROM institution_snapshots
+      ORDER BY institution_id, month_start DESC
+    ),
+    prior AS (
+      SELECT DISTINCT ON (s.institution_id)
+        s.institution_id,
+        s.as_of,
+        s.total_amount
+      FROM institution_snapshots s
+      JOIN latest l ON l.institution_id = s.institution_id
+      WHERE s.month_start < l.month_start
+      ORDER BY s.institution_id, s.month_start DESC
+    ),
+    changes AS (
+      SELECT
+        l.institution_id,
+        l.institution_name,
+        l.institution_type,
+        l.as_of AS current_as_of,
+        COALESCE(p.as_of, l.as_of) AS previous_as_of,
+        l.total_amount AS current_total,
+        COALESCE(p.total_amount, 0) AS previous_total,
+        (l.total_amount - COALESCE(p.total_amount, 0)) AS delta
+      FROM latest l
+      LEFT JOIN prior p ON p.institution_id = l.institution_id
+      WHERE l.total_amount IS NOT NULL
+    ),
+    positioned AS (
+      SELECT
+        c.*,
+        row_number() OVER (ORDER BY c.delta DESC) AS pos,
+        count(*) OVER () AS n
+      FROM changes c
+    )
+    SELECT
+      institution_id,
+      institution_name,
+      institution_type,
+      current_as_of,
+      previous_as_of,
+      current_total,
+      previous_total,
+      delta
+    FROM positioned
+    WHERE pos <= (LEAST(:limit, n) + 1) / 2
+       OR pos > n - LEAST(:limit, n) / 2
+    ORDER BY pos
+    """
+)
+
+
 @router.get("/institutions/assets/changes", response_model=InstitutionAssetChangeOut)
 def list_institution_asset_changes(
     limit: int = Query(10, ge=1, le=200),
@@ -119,125 +244,75 @@ def list_institution_asset_changes(
 ):
     base_currency = pref.base_currency
 
-    sql = text(
-        """
-        WITH balance_ranked AS (
-          SELECT
-            i.id AS institution_id,
-            i.name AS institution_name,
-            i.type AS institution_type,
-            date_trunc('month', pb.as_of) AS month_start,
-            pb.as_of,
-            pb.amount,
-            fp.currency,
-            row_number() OVER (
-              PARTITION BY pb.product_id, date_trunc('month', pb.as_of)
-              ORDER BY pb.as_of DESC
-            ) AS rn,
-        """
-        + get_exchange_rate_by_as_of(
-            code=":target_code",
-            as_of="pb",
-            column="fx_rate",
-            currency="fp",
-        )
-        + """
-          FROM deposit.product_balances pb
-          JOIN deposit.financial_products fp ON fp.id = pb.product_id
-          JOIN deposit.institutions i ON i.id = fp.institution_id
-          WHERE i.user_id = :user_id
-            AND fp.status != 'closed'
-        ),
-        balance_fx AS (
-          SELECT
-            institution_id,
-            institution_name,
-            institution_type,
-            month_start,
-            as_of,
-            amount,
-            fx_rate
-          FROM balance_ranked
-          WHERE rn = 1
-        ),
-        institution_snapshots AS (
-          SELECT
-            institution_id,
-            institution_name,
-            institution_type,
-            month_start,
-            MAX(as_of) AS as_of,
-            SUM(amount * fx_rate) AS total_amount
-          FROM balance_fx
-          WHERE fx_rate IS NOT NULL
-          GROUP BY institution_id, institution_name, institution_type, month_start
-        ),
-        ranked AS (
-          SELECT
-            institution_id,
-            institution_name,
-            institution_type,
-            as_of,
-            total_amount,
-            row_number() OVER (PARTITION BY institution_id ORDER BY month_start DESC) AS rn
-          FROM institution_snapshots
-        ),
-        pivot AS (
-          SELECT
-            institution_id,
-            institution_name,
-            institution_type,
-            MAX(CASE WHEN rn = 1 THEN as_of END) AS current_as_of,
-            MAX(CASE WHEN rn = 1 THEN total_amount END) AS current_total,
-            MAX(CASE WHEN rn = 2 THEN as_of END) AS previous_as_of,
-            MAX(CASE WHEN rn = 2 THEN total_amount END) AS previous_total
-          FROM ranked
-          WHERE rn <= 2
-          GROUP BY institution_id, institution_name, institution_type
-        )
-        SELECT
-          institution_id,
-          institution_name,
-          institution_type,
-          current_as_of,
-          COALESCE(previous_as_of, current_as_of) AS previous_as_of,
-          current_total,
-          COALESCE(previous_total, 0) AS previous_total,
-          (current_total - COALESCE(previous_total, 0)) AS delta
-        FROM pivot
-        WHERE current_total IS NOT NULL
-        ORDER BY delta DESC
-        """
-    )
+    # The head/tail trim (top half of the gainers, bottom half of the
+    # losers) happens in SQL now; only the kept rows cross the wire.
     rows = db.execute(
-        sql,
+        _SQL_CHANGES,
         {"user_id": current_user.id, "target_code": base_currency, "limit": limit},
     ).mappings()
-    rows = list(rows)
-    limit = min(limit, len(rows))
-    head_count = (limit + 1) // 2   # 前半：向上取整
-    tail_count = limit // 2         # 后半：向下取整
-    head = rows[:head_count]
-    tail = rows[-tail_count:] if tail_count else []
-    rows = head + tail
-    data = [
-        InstitutionAssetChange(
-            institution_id=row["institution_id"],
-            institution_name=row["institution_name"],
-            institution_type=row["institution_type"],
-            current_as_of=row["current_as_of"],
-            previous_as_of=row["previous_as_of"],
-            current_total=row["current_total"],
-            previous_total=row["previous_total"],
-            delta=row["delta"],
-        )
-        for row in rows
-    ]
+    # model_construct: the SQL projection already matches the schema, so
+    # skip per-row validation; response_model still serializes the shape.
+    data = [InstitutionAssetChange.model_construct(**row) for row in rows]
     return InstitutionAssetChangeOut(
         currency=base_currency,
         total=len(data),
         data=data,
-    ).model_dump()
+    )
+
+
+_SQL_MONTHLY = text(
+    """
+    WITH monthly_last AS (
+      SELECT
+        pb.product_id,
+        fp.currency,
+        date_trunc('month', pb.as_of)::date AS month_start,
+        pb.as_of,
+        pb.amount,
+        row_number() OVER (
+          PARTITION BY pb.product_id, date_trunc('month', pb.as_of)
+          ORDER BY pb.as_of DESC
+        ) AS rn
+      FROM deposit.product_balances pb
+      JOIN deposit.financial_products fp ON fp.id = pb.product_id
+      JOIN deposit.institutions i ON i.id = fp.institution_id
+      WHERE i.user_id = :user_id
+        AND (:from_dt IS NULL OR pb.as_of >= :from_dt)
+        AND (:to_dt IS NULL OR pb.as_of < :to_dt)
+        AND fp.status != 'closed'
+    ),
+    last_rows AS (
+      SELECT * FROM monthly_last WHERE rn = 1
+    ),
+    fx_keys AS (
+      SELECT DISTINCT currency, as_of FROM last_rows
+    ),
+    fx_monthly AS (
+      SELECT
+        k.currency,
+        k.as_of,
+    """
+    + get_exchange_rate_by_as_of(
+        code=":target_code",
+        as_of="k",
+        column="fx_rate",
+        currency="k",
+    )
+    + """
+      FROM fx_keys k
+    )
+    SELECT
+      m.month_start AS month,
+      SUM(m.amount * fx.fx_rate) AS total_amount
+    FROM last_rows m
+    JOIN fx_monthly fx
+      ON fx.currency = m.currency AND fx.as_of = m.as_of
+    WHERE fx.fx_rate IS NOT NULL
+    GROUP BY m.month_start
+    ORDER BY m.month_start DESC
+    LIMIT :limit
+    """
+)
 
 
 @router.get("/assets/monthly", response_model=MonthlyAssetTrend)
@@ -253,51 +328,11 @@ def get_monthly_assets(
     from_dt, to_dt = normalize_datetime_range(request, from_dt, to_dt)
     base_currency = pref.base_currency
 
-    sql = text(
-        """
-        WITH monthly_last AS (
-          SELECT
-            pb.product_id,
-            fp.currency,
-            date_trunc('month', pb.as_of)::date AS month_start,
-            pb.as_of,
-            pb.amount,
-            row_number() OVER (
-              PARTITION BY pb.product_id, date_trunc('month', pb.as_of)
-              ORDER BY pb.as_of DESC
-            ) AS rn
-          FROM deposit.product_balances pb
-          JOIN deposit.financial_products fp ON fp.id = pb.product_id
-          JOIN deposit.institutions i ON i.id = fp.institution_id
-          WHERE i.user_id = :user_id
-            AND (:from_dt IS NULL OR pb.as_of >= :from_dt)
-            AND (:to_dt IS NULL OR pb.as_of < :to_dt)
-            AND fp.status != 'closed'
-        )
-        SELECT
-          m.month_start AS month,
-          SUM(m.amount * fx.fx_rate) AS total_amount
-        FROM monthly_last m
-        LEFT JOIN LATERAL (
-          SELECT
-        """
-        + get_exchange_rate_by_as_of(
-            code=":target_code",
-            as_of="m",
-            column="fx_rate",
-            currency="m",
-        )
-        + """
-        ) fx ON true
-        WHERE m.rn = 1
-          AND fx.fx_rate IS NOT NULL
-        GROUP BY m.month_start
-        ORDER BY m.month_start DESC
-        LIMIT :limit
-        """
-    )
+    # The FX subquery is evaluated once per distinct (currency, as_of)
+    # pair instead of per balance row: deduplicate the keys first, rate
+    # them in one CTE, and hash-join the result back onto the rows.
     rows = db.execute(
-        sql,
+        _SQL_MONTHLY,
         {
             "user_id": current_user.id,
             "from_dt": from_dt,
@@ -307,11 +342,47 @@ def get_monthly_assets(
         },
     ).mappings()
 
+    # Trusted projection: construct without the per-row validation pass.
     data = [
-        MonthlyAssetPoint(month=row["month"], amount=row["total_amount"])
+        MonthlyAssetPoint.model_construct(month=row["month"], amount=row["total_amount"])
         for row in rows
     ]
-    return MonthlyAssetTrend(currency=base_currency, data=data).model_dump()
+    return MonthlyAssetTrend(currency=base_currency, data=data)
+
+
+_SQL_LATEST = text(
+    """
+    WITH balance_fx AS (
+      SELECT
+        i.id AS institution_id,
+        i.name AS institution_name,
+        fp.amount_updated_at::date AS as_of,
+        fp.amount,
+        fp.currency,
+    """
+    + get_exchange_rate_by_as_of(
+        code=":target_code",
+        as_of="fp",
+        column="fx_rate",
+        currency="fp",
+        as_of_column="amount_updated_at",
+    )
+    + """
+      FROM deposit.financial_products fp
+      JOIN deposit.institutions i ON i.id = fp.institution_id
+      WHERE i.user_id = :user_id
+        AND fp.status = 'active'
+    )
+    SELECT
+      as_of,
+      SUM(amount * fx_rate) AS total_amount
+    FROM balance_fx
+    WHERE fx_rate IS NOT NULL
+    GROUP BY balance_fx.as_of
+    ORDER BY balance_fx.as_of DESC
+    LIMIT 1
+    """
+)
 
 
 @router.get("/total/assets/latest", response_model=LatestAumontTotalOut)
@@ -322,41 +393,8 @@ def get_latest_total_amount(
 ):
     base_currency = pref.base_currency
 
-    sql = text(
-        """
-        WITH balance_fx AS (
-          SELECT
-            i.id AS institution_id,
-            i.name AS institution_name,
-            fp.amount_updated_at::date AS as_of,
-            fp.amount,
-            fp.currency,
-        """
-        + get_exchange_rate_by_as_of(
-            code=":target_code",
-            as_of="fp",
-            column="fx_rate",
-            currency="fp",
-            as_of_column="amount_updated_at",
-        )
-        + """
-          FROM deposit.financial_products fp
-          JOIN deposit.institutions i ON i.id = fp.institution_id
-          WHERE i.user_id = :user_id
-            AND fp.status = 'active'
-        )
-        SELECT
-          as_of,
-          SUM(amount * fx_rate) AS total_amount
-        FROM balance_fx
-        WHERE fx_rate IS NOT NULL
-        GROUP BY balance_fx.as_of
-        ORDER BY balance_fx.as_of DESC
-        LIMIT 1
-        """
-    )
     rows = list(db.execute(
-        sql,
+        _SQL_LATEST,
         {
             "user_id": current_user.id,
             "target_code": base_currency,
@@ -367,52 +405,58 @@ def get_latest_total_amount(
         currency=base_currency,
         datetime=row["as_of"],
         total=row["total_amount"],
-    ).model_dump()
+    )
     
-@router.get("/total/products/compare", response_model=AssetCurrencyTotalOut)
-def get_total_assets_by_currency(
-    key: str = Query("currency", regex="^(currency|product_type)$"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-    pref: UserPreference = Depends(get_user_pref),
-):
-    base_currency = pref.base_currency
-
-    sql = text(
+def _compare_sql(key: str):
+    return text(
         f"""
         WITH monthly_last AS (
           SELECT
             fp.{key} AS target,
+            fp.currency,
             date_trunc('month', pb.as_of) AS month_start,
             pb.as_of,
             pb.amount,
             row_number() OVER (
               PARTITION BY pb.product_id, date_trunc('month', pb.as_of)
               ORDER BY pb.as_of DESC
-            ) AS rn,
+            ) AS rn
+          FROM deposit.product_balances pb
+          JOIN deposit.financial_products fp ON fp.id = pb.product_id
+          JOIN deposit.institutions i ON i.id = fp.institution_id
+          WHERE i.user_id = :user_id
+            AND fp.status != 'closed'
+        ),
+        last_rows AS (
+          SELECT * FROM monthly_last WHERE rn = 1
+        ),
+        fx_keys AS (
+          SELECT DISTINCT currency, as_of FROM last_rows
+        ),
+        fx_rates AS (
+          SELECT
+            k.currency,
+            k.as_of,
         """
         + get_exchange_rate_by_as_of(
             code=":target_code",
-            as_of="pb",
+            as_of="k",
             column="fx_rate",
-            currency="fp",
+            currency="k",
         )
         + """
-          FROM deposit.product_balances pb
-          JOIN deposit.financial_products fp ON fp.id = pb.product_id
-          JOIN deposit.institutions i ON i.id = fp.institution_id
-          WHERE i.user_id = :user_id
-            AND fp.status != 'closed'
+          FROM fx_keys k
         ),
         target_monthly_totals AS (
           SELECT
-            target,
-            month_start,
-            SUM(amount * fx_rate) AS total
-          FROM monthly_last
-          WHERE rn = 1
-            AND fx_rate IS NOT NULL
-          GROUP BY target, month_start
+            m.target,
+            m.month_start,
+            SUM(m.amount * fx.fx_rate) AS total
+          FROM last_rows m
+          JOIN fx_rates fx
+            ON fx.currency = m.currency AND fx.as_of = m.as_of
+          WHERE fx.fx_rate IS NOT NULL
+          GROUP BY m.target, m.month_start
         ),
         ranked AS (
           SELECT
@@ -433,32 +477,85 @@ def get_total_assets_by_currency(
         )
         SELECT
           target,
-          current_total,
-          COALESCE(previous_total, 0) AS previous_total
+          current_total::float8 AS current_total,
+          (current_total - COALESCE(previous_total, 0))::float8 AS change,
+          COALESCE(
+            (current_total - COALESCE(previous_total, 0))
+              / NULLIF(current_total, 0),
+            0
+          )::float8 AS rate
         FROM pivot
         WHERE current_total IS NOT NULL
         """
     )
-    rows = list(db.execute(
+
+
+_SQL_COMPARE_BY_KEY = {k: _compare_sql(k) for k in ("currency", "product_type")}
+
+
+@router.get("/total/products/compare", response_model=AssetCurrencyTotalOut)
+def get_total_assets_by_currency(
+    key: str = Query("currency", regex="^(currency|product_type)$"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    pref: UserPreference = Depends(get_user_pref),
+):
+    base_currency = pref.base_currency
+
+    sql = _SQL_COMPARE_BY_KEY[key]
+    rows = db.execute(
         sql,
         {
             "user_id": current_user.id,
             "target_code": base_currency,
         },
-    ).mappings())
-    results: List[AssetCurrencyPoint] = []
-    for row in rows:
-        change = row["current_total"] - row["previous_total"]
-        rate = change / row["current_total"] if row["current_total"] else Decimal("0")
-        results.append(AssetCurrencyPoint(
+    ).mappings()
+    # change and rate come back precomputed from the pivot, so each row
+    # maps straight onto a point with no per-row arithmetic here.
+    results = [
+        AssetCurrencyPoint(
             target=row["target"],
             amount=row["current_total"],
-            change=change,
-            rate=rate,
-        ))
+            change=row["change"],
+            rate=row["rate"],
+        )
+        for row in rows
+    ]
     return AssetCurrencyTotalOut(
         data=results
-    ).model_dump()
+    )
+
+
+# The two periods are contiguous ([prev_from, from) and [from, to)), so
+# one scan over the combined window with a per-row bucket flag replaces
+# the twin CTEs that each re-ran the correlated FX lookup.
+_SQL_EXPENSE_COMPARE = text(
+    """
+    WITH expense_fx AS (
+      SELECT
+        e.amount,
+        (e.occurred_at >= :from_dt) AS in_current,
+    """
+    + get_exchange_rate_by_as_of(
+        code=":target_code",
+        as_of="e",
+        column="fx_rate",
+        currency="e",
+        as_of_column="occurred_at",
+    )
+    + """
+      FROM expense.expenses e
+      WHERE e.user_id = :user_id
+        AND e.occurred_at >= :prev_from
+        AND e.occurred_at < :to_dt
+    )
+    SELECT
+      COALESCE(SUM(amount * fx_rate) FILTER (WHERE in_current), 0) AS current_total,
+      COALESCE(SUM(amount * fx_rate) FILTER (WHERE NOT in_current), 0) AS previous_total
+    FROM expense_fx
+    WHERE fx_rate IS NOT NULL
+    """
+)
 
 
 @router.get("/expenses/total/compare", response_model=ExpensePeriodCompareOut)
@@ -482,71 +579,13 @@ def get_expense_total_compare(
 
     base_currency = pref.base_currency
 
-    sql = text(
-        """
-        WITH current_fx AS (
-          SELECT
-            e.amount,
-            e.currency,
-            e.occurred_at,
-        """
-        + get_exchange_rate_by_as_of(
-            code=":target_code",
-            as_of="e",
-            column="fx_rate",
-            currency="e",
-            as_of_column="occurred_at",
-        )
-        + """
-          FROM expense.expenses e
-          WHERE e.user_id = :user_id
-            AND e.occurred_at >= :from_dt
-            AND e.occurred_at < :to_dt
-        ),
-        current_total AS (
-          SELECT COALESCE(SUM(amount * fx_rate), 0) AS total
-          FROM current_fx
-          WHERE fx_rate IS NOT NULL
-        ),
-        previous_fx AS (
-          SELECT
-            e.amount,
-            e.currency,
-            e.occurred_at,
-        """
-        + get_exchange_rate_by_as_of(
-            code=":target_code",
-            as_of="e",
-            column="fx_rate",
-            currency="e",
-            as_of_column="occurred_at",
-        )
-        + """
-          FROM expense.expenses e
-          WHERE e.user_id = :user_id
-            AND e.occurred_at >= :prev_from
-            AND e.occurred_at < :prev_to
-        ),
-        previous_total AS (
-          SELECT COALESCE(SUM(amount * fx_rate), 0) AS total
-          FROM previous_fx
-          WHERE fx_rate IS NOT NULL
-        )
-        SELECT
-          current_total.total AS current_total,
-          previous_total.total AS previous_total
-        FROM current_total
-        CROSS JOIN previous_total
-        """
-    )
     row = db.execute(
-        sql,
+        _SQL_EXPENSE_COMPARE,
         {
             "user_id": current_user.id,
             "from_dt": from_dt,
             "to_dt": to_dt,
             "prev_from": prev_from,
-            "prev_to": prev_to,
             "target_code": base_currency,
         },
     ).mappings().first()
@@ -566,5 +605,5 @@ def get_expense_total_compare(
         previous_total=previous_total,
         delta=delta,
         delta_rate=delta_rate,
-    ).model_dump()
+    )
     
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from decimal import Decimal
-from io import BytesIO
 from typing import List, Optional
 
 from pathlib import Path
@@ -11,7 +10,7 @@ from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Qu
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field, validator
-from sqlalchemy import func, desc
+from sqlalchemy import func, desc, insert
 from sqlalchemy.orm import Session
 
 from ..auth import resolve_user_id
@@ -27,6 +26,7 @@ from ..import_tasks import create_task, get_task, save_upload_file, update_task
 from ..importers.deposit_excel import parse_deposit_import_path
 from ..models import Currency, FinancialProduct, Institution, ProductBalance, User, Expense
 from ..schemas.deposit_import import (
+    ImportBalanceItem,
     ImportBalanceResult,
     ImportDepositRequest,
     ImportDepositResponse,
@@ -57,7 +57,8 @@ def _now() -> datetime:
 
 def _ensure_xlsx_upload(upload: UploadFile) -> str:
     filename = upload.filename or ""
-    if not filename.lower().endswith(".xlsx"):
+    # Lowercase only the extension instead of copying the whole filename.
+    if len(filename) < 5 or filename[-5:].lower() != ".xlsx":
         raise HTTPException(status_code=422, detail="invalid_file_type")
     return filename
 
@@ -1060,6 +1061,67 @@ def _ensure_unique_product_names(items: List[BaseModel]) -> None:
         raise HTTPException(status_code=422, detail=f"duplicate_product:{dup_list}")
 
 
+def _as_of_key(value: datetime) -> datetime:
+    """Canonical dedupe key: aware datetimes collapse to naive UTC."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _insert_balances_row_by_row(
+    pending: List[tuple[ImportBalanceItem, int]],
+    db: Session,
+    bal_results: List[ImportBalanceResult],
+) -> None:
+    for item, prod_id in pending:
+        existing = (
+            db.query(ProductBalance)
+            .filter(ProductBalance.product_id == prod_id, ProductBalance.as_of == item.as_of)
+            .first()
+        )
+        if existing:
+            bal_results.append(
+                ImportBalanceResult(
+                    institution_name=item.institution_name,
+                    product_name=item.product_name,
+                    as_of=item.as_of,
+                    status="exists",
+                )
+            )
+            continue
+        now = _now()
+        bal = ProductBalance(
+            product_id=prod_id,
+            amount=item.amount,
+            as_of=item.as_of,
+            created_at=now,
+            updated_at=now,
+        )
+        try:
+            db.add(bal)
+            db.commit()
+        except Exception:
+            db.rollback()
+            bal_results.append(
+                ImportBalanceResult(
+                    institution_name=item.institution_name,
+                    product_name=item.product_name,
+                    as_of=item.as_of,
+                    status="failed",
+                    error="balance_create_failed",
+                )
+            )
+            continue
+        bal_results.append(
+            ImportBalanceResult(
+                institution_name=item.institution_name,
+                product_name=item.product_name,
+                as_of=item.as_of,
+                status="created",
+            )
+        )
+
+
 def _import_deposit_payload(
     payload: ImportDepositRequest,
     db: Session,
@@ -1101,18 +1163,23 @@ def _import_deposit_payload(
             latest_as_of[key] = item.as_of
             latest_amounts[key] = item.amount
 
-    for item in payload.institutions:
-        existing = (
-            db.query(Institution)
-            .filter(Institution.user_id == current_user.id, Institution.name == item.name)
-            .first()
+    # One query resolves every pre-existing institution instead of a
+    # round trip per row.
+    existing_inst_ids: dict[str, int] = {
+        name: inst_id
+        for inst_id, name in db.query(Institution.id, Institution.name).filter(
+            Institution.user_id == current_user.id,
+            Institution.name.in_([item.name for item in payload.institutions]),
         )
-        if existing:
-            inst_map[item.name] = existing.id
+    }
+    for item in payload.institutions:
+        existing_id = existing_inst_ids.get(item.name)
+        if existing_id is not None:
+            inst_map[item.name] = existing_id
             inst_results.append(
                 ImportInstitutionResult(
                     institution_name=item.name,
-                    institution_id=existing.id,
+                    institution_id=existing_id,
                     status="exists",
                 )
             )
@@ -1151,6 +1218,18 @@ def _import_deposit_payload(
             )
         )
 
+    # Same batching for products: fetch all (institution_id, name) pairs
+    # that already exist in one query.
+    existing_prod_ids: dict[tuple[int, str], int] = {}
+    if inst_map:
+        for prod_id, prod_inst_id, prod_name in db.query(
+            FinancialProduct.id, FinancialProduct.institution_id, FinancialProduct.name
+        ).filter(
+            FinancialProduct.institution_id.in_(inst_map.values()),
+            FinancialProduct.name.in_([item.name for item in payload.products]),
+        ):
+            existing_prod_ids[(prod_inst_id, prod_name)] = prod_id
+
     for item in payload.products:
         inst_id = inst_map.get(item.institution_name)
         if not inst_id:
@@ -1177,18 +1256,14 @@ def _import_deposit_payload(
             )
             continue
 
-        existing = (
-            db.query(FinancialProduct)
-            .filter(FinancialProduct.institution_id == inst_id, FinancialProduct.name == item.name)
-            .first()
-        )
-        if existing:
-            prod_map[(inst_id, existing.name)] = existing.id
+        existing_id = existing_prod_ids.get((inst_id, item.name))
+        if existing_id is not None:
+            prod_map[(inst_id, item.name)] = existing_id
             prod_results.append(
                 ImportProductResult(
                     institution_name=item.institution_name,
                     product_name=item.name,
-                    product_id=existing.id,
+                    product_id=existing_id,
                     status="exists",
                 )
             )
@@ -1234,6 +1309,21 @@ def _import_deposit_payload(
             )
         )
 
+    # Balances dominate import volume, so they get the full bulk
+    # treatment: one query for existing (product_id, as_of) pairs, then a
+    # single executemany insert instead of query+commit per row. If the
+    # bulk insert fails (e.g. a concurrent writer hit the unique index),
+    # fall back to the per-row path so results stay row-accurate.
+    existing_bal_keys: set[tuple[int, datetime]] = set()
+    if prod_map:
+        existing_bal_keys = {
+            (prod_id, _as_of_key(as_of))
+            for prod_id, as_of in db.query(
+                ProductBalance.product_id, ProductBalance.as_of
+            ).filter(ProductBalance.product_id.in_(prod_map.values()))
+        }
+
+    pending: List[tuple[ImportBalanceItem, int]] = []
     for item in payload.product_balances:
         inst_id = inst_map.get(item.institution_name)
         if not inst_id:
@@ -1260,12 +1350,8 @@ def _import_deposit_payload(
             )
             continue
 
-        existing = (
-            db.query(ProductBalance)
-            .filter(ProductBalance.product_id == prod_id, ProductBalance.as_of == item.as_of)
-            .first()
-        )
-        if existing:
+        key = (prod_id, _as_of_key(item.as_of))
+        if key in existing_bal_keys:
             bal_results.append(
                 ImportBalanceResult(
                     institution_name=item.institution_name,
@@ -1275,40 +1361,38 @@ def _import_deposit_payload(
                 )
             )
             continue
+        # Mark the key as taken so in-file duplicates report "exists".
+        existing_bal_keys.add(key)
+        pending.append((item, prod_id))
 
+    if pending:
         now = _now()
-        bal = ProductBalance(
-            product_id=prod_id,
-            amount=item.amount,
-            as_of=item.as_of,
-            created_at=now,
-            updated_at=now,
-        )
+        rows = [
+            {
+                "product_id": prod_id,
+                "amount": item.amount,
+                "as_of": item.as_of,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for item, prod_id in pending
+        ]
         try:
-            db.add(bal)
+            db.execute(insert(ProductBalance), rows)
             db.commit()
-            db.refresh(bal)
         except Exception:
             db.rollback()
-            bal_results.append(
+            _insert_balances_row_by_row(pending, db, bal_results)
+        else:
+            bal_results.extend(
                 ImportBalanceResult(
                     institution_name=item.institution_name,
                     product_name=item.product_name,
                     as_of=item.as_of,
-                    status="failed",
-                    error="balance_create_failed",
+                    status="created",
                 )
+                for item, _ in pending
             )
-            continue
-
-        bal_results.append(
-            ImportBalanceResult(
-                institution_name=item.institution_name,
-                product_name=item.product_name,
-                as_of=item.as_of,
-                status="created",
-            )
-        )
 
     def _section_stats(results: List[BaseModel]) -> ImportSectionResult:
         total = len(results)
@@ -1390,7 +1474,7 @@ def export_deposit_data(
     filename = f"deposit_export_{current_user.id}_{_now().strftime('%Y%m%d%H%M%S')}.xlsx"
     headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
     return StreamingResponse(
-        BytesIO(content),
+        content,
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers=headers,
     )
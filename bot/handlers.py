@@ -4,6 +4,7 @@ from typing import Optional, Any, Callable, Awaitable
 from decimal import Decimal, ROUND_HALF_UP
 from pathlib import Path
 import asyncio
+import logging
 import httpx
 from uuid import uuid4
 
@@ -28,6 +29,7 @@ from handler_utils import (
 
 
 router = Router()
+logger = logging.getLogger(__name__)
 _service: Optional[BotService] = None
 
 
@@ -382,7 +384,7 @@ async def handle_set_category(callback: CallbackQuery) -> None:
     async def payload_editor(svc: BotService, token: str, category_id: str) -> Awaitable[dict[str, Any]]:
         payload: dict[str, Any] = {}
         categories = await svc_request(token, lambda t: svc.list_categories(t))
-        print(f"Categories: {categories} looking for {category_id}")
+        logger.debug("categories=%s looking for %s", categories, category_id)
         match = next((c for c in categories if c.get("id") == int(category_id)), None)
         if not match:
             raise ValueError("Category not found.")
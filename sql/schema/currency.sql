@@ -12,12 +12,26 @@ CREATE TABLE IF NOT EXISTS currency.currencies (
   code        TEXT PRIMARY KEY,
   name        TEXT NOT NULL,
   symbol      TEXT NULL,
-  scale       INT  NOT NULL DEFAULT 2,
+  scale       SMALLINT NOT NULL DEFAULT 2,
   created_at  TIMESTAMPTZ NOT NULL DEFAULT now(),
   updated_at  TIMESTAMPTZ NOT NULL DEFAULT now(),
   CONSTRAINT ck_currencies__scale CHECK (scale BETWEEN 0 AND 6)
 );
 
+-- Databases created before scale became SMALLINT still carry INT; the
+-- guard keeps the re-apply from rewriting the table on every deploy.
+DO $$
+BEGIN
+  IF EXISTS (
+    SELECT 1 FROM information_schema.columns
+    WHERE table_schema = 'currency' AND table_name = 'currencies'
+      AND column_name = 'scale' AND data_type = 'integer'
+  ) THEN
+    ALTER TABLE currency.currencies ALTER COLUMN scale TYPE SMALLINT;
+  END IF;
+END;
+$$;
+
 DROP TRIGGER IF EXISTS trg_currencies__upd ON currency.currencies;
 CREATE TRIGGER trg_currencies__upd
 BEFORE UPDATE ON currency.currencies
@@ -42,8 +56,13 @@ CREATE TRIGGER trg_exchange_rates__upd
 BEFORE UPDATE ON currency.exchange_rates
 FOR EACH ROW EXECUTE FUNCTION currency.tg_set_updated_at();
 
-CREATE INDEX IF NOT EXISTS idx_exchange_rates__pair_date_desc
-ON currency.exchange_rates (base_code, quote_code, rate_date DESC);
+-- Superseded by the covering variant below; no-op on fresh installs.
+DROP INDEX IF EXISTS currency.idx_exchange_rates__pair_date_desc;
+
+-- INCLUDE (rate) makes latest-rate-for-pair lookups index-only scans.
+CREATE INDEX IF NOT EXISTS idx_exchange_rates__pair_date_rate
+ON currency.exchange_rates (base_code, quote_code, rate_date DESC)
+INCLUDE (rate);
 
 -- Seeds
 INSERT INTO currency.currencies(code, name, symbol, scale)
@@ -85,3 +85,7 @@ WHERE source_ref IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_expenses__user_occurred_at_desc
 ON expense.expenses (user_id, occurred_at DESC);
 
+-- Serves per-user category aggregation without touching occurred_at.
+CREATE INDEX IF NOT EXISTS idx_expenses__user_category
+ON expense.expenses (user_id, category_id);
+
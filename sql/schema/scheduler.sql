@@ -49,6 +49,12 @@ CREATE TABLE IF NOT EXISTS scheduler.job_runs (
 CREATE INDEX IF NOT EXISTS idx_job_runs__job_scheduled
 ON scheduler.job_runs (job_id, scheduled_at);
 
+-- Partial index keeps the work-queue scan over pending runs small no
+-- matter how much history the table accumulates.
+CREATE INDEX IF NOT EXISTS idx_job_runs__pending
+ON scheduler.job_runs (scheduled_at)
+WHERE status = 'pending';
+
 DROP TRIGGER IF EXISTS trg_job_runs__upd ON scheduler.job_runs;
 CREATE TRIGGER trg_job_runs__upd
 BEFORE UPDATE ON scheduler.job_runs
@@ -0,0 +1,106 @@
+import io
+import zipfile
+from datetime import datetime
+
+from app.importers._xlsx_stream import XlsxStreamReader
+
+_WORKBOOK_RELS = """<?xml version="1.0" encoding="UTF-8"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+  <Relationship Id="rId1"
+    Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"
+    Target="worksheets/sheet1.xml"/>
+</Relationships>"""
+
+_WORKBOOK_TMPL = """<?xml version="1.0" encoding="UTF-8"?>
+<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+    xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+  {workbook_pr}
+  <sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>
+</workbook>"""
+
+# cellXfs index 0 is General, index 1 is the built-in short date format.
+_STYLES = """<?xml version="1.0" encoding="UTF-8"?>
+<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+  <cellXfs count="2">
+    <xf numFmtId="0"/>
+    <xf numFmtId="14"/>
+  </cellXfs>
+</styleSheet>"""
+
+_SHEET_TMPL = """<?xml version="1.0" encoding="UTF-8"?>
+<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+  <sheetData>{rows}</sheetData>
+</worksheet>"""
+
+
+def _workbook(rows: str, shared_strings: str = "", date1904: bool = False) -> io.BytesIO:
+    buf = io.BytesIO()
+    workbook_pr = '<workbookPr date1904="1"/>' if date1904 else ""
+    with zipfile.ZipFile(buf, "w") as archive:
+        archive.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+        archive.writestr("xl/workbook.xml", _WORKBOOK_TMPL.format(workbook_pr=workbook_pr))
+        archive.writestr("xl/styles.xml", _STYLES)
+        archive.writestr("xl/worksheets/sheet1.xml", _SHEET_TMPL.format(rows=rows))
+        if shared_strings:
+            archive.writestr(
+                "xl/sharedStrings.xml",
+                '<?xml version="1.0" encoding="UTF-8"?>'
+                '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                f"{shared_strings}</sst>",
+            )
+    buf.seek(0)
+    return buf
+
+
+def _read_rows(buf: io.BytesIO) -> list:
+    with XlsxStreamReader(buf) as reader:
+        return list(reader.iter_rows("Sheet1"))
+
+
+def test_shared_strings_plain_and_rich_text() -> None:
+    shared = "<si><t>plain</t></si><si><r><t>ri</t></r><r><t>ch</t></r></si>"
+    rows = (
+        '<row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1" t="s"><v>1</v></c></row>'
+    )
+    assert _read_rows(_workbook(rows, shared)) == [("plain", "rich")]
+
+
+def test_shared_strings_skip_phonetic_runs() -> None:
+    # <rPh> carries furigana/pinyin annotations, not cell content.
+    shared = (
+        '<si><t>日本語</t><rPh sb="0" eb="3"><t>ニホンゴ</t></rPh></si>'
+        '<si><r><t>日本</t></r><r><t>語</t></r>'
+        '<rPh sb="0" eb="3"><t>ニホンゴ</t></rPh></si>'
+    )
+    rows = (
+        '<row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1" t="s"><v>1</v></c></row>'
+    )
+    assert _read_rows(_workbook(rows, shared)) == [("日本語", "日本語")]
+
+
+def test_inline_strings() -> None:
+    rows = (
+        '<row r="1">'
+        '<c r="A1" t="inlineStr"><is><t>inline</t></is></c>'
+        '<c r="B1" t="inlineStr"><is><r><t>日本語</t></r>'
+        '<rPh sb="0" eb="3"><t>ニホンゴ</t></rPh></is></c>'
+        "</row>"
+    )
+    assert _read_rows(_workbook(rows)) == [("inline", "日本語")]
+
+
+def test_date_cells_1900_system() -> None:
+    # Serial 43831 is 2020-01-01 in the default 1900 date system.
+    rows = '<row r="1"><c r="A1" s="1"><v>43831</v></c><c r="B1"><v>43831</v></c></row>'
+    assert _read_rows(_workbook(rows)) == [(datetime(2020, 1, 1), 43831)]
+
+
+def test_date_cells_1904_system() -> None:
+    # The same calendar date is serial 42369 when workbookPr date1904 is set.
+    rows = '<row r="1"><c r="A1" s="1"><v>42369</v></c></row>'
+    assert _read_rows(_workbook(rows, date1904=True)) == [(datetime(2020, 1, 1),)]
+
+
+def test_sparse_rows_pad_missing_cells() -> None:
+    rows = '<row r="1"><c r="A1"><v>1</v></c><c r="D1"><v>4</v></c></row>'
+    assert _read_rows(_workbook(rows)) == [(1, None, None, 4)]